@@ -4,7 +4,24 @@ Entry point for GPW Stock Monitor.
 This script allows running the application from the project root.
 """
 
-from src.gpw_kurs import main
+import importlib.util
+import sys
+
+REQUIRED_PACKAGES = ('rich', 'yfinance', 'numpy')
+
+
+def ensure_deps():
+    """Exit with an installation hint if a required package is missing."""
+    missing = [name for name in REQUIRED_PACKAGES if importlib.util.find_spec(name) is None]
+    if missing:
+        sys.exit(
+            f"Missing required packages: {', '.join(missing)}\n"
+            f"Install them with: pip install {' '.join(missing)}"
+        )
+
 
 if __name__ == "__main__":
+    ensure_deps()
+    
+    from src.gpw_kurs import main
     main()
@@ -3,6 +3,19 @@ Calculations module for GPW Stock Monitor.
 Handles financial calculations like profit/loss.
 """
 
+import numpy as np
+
+# Rich style names for profit/loss cells
+STYLE_PROFIT = "green"
+STYLE_LOSS = "red"
+STYLE_NO_VALUE = "dim"
+
+# (percent format, amount format, style) indexed by is_profit
+_ROW_FORMATS = (
+    ("{:.2f}%".format, "{:.2f} {}".format, STYLE_LOSS),
+    ("+{:.2f}%".format, "+{:.2f} {}".format, STYLE_PROFIT),
+)
+
 
 def calculate_profit_loss(current_price, purchase_price):
     """
@@ -26,6 +39,35 @@ def calculate_profit_loss(current_price, purchase_price):
     return percent_change, amount_change, is_profit
 
 
+def calculate_profit_loss_batch(current_prices, purchase_prices):
+    """
+    Calculates profit/loss for many stocks at once with NumPy.
+    
+    Args:
+        current_prices: Sequence of current stock prices (NaN where unknown)
+        purchase_prices: Sequence of stock purchase prices
+    
+    Returns:
+        List of (percent_change, amount_change, is_profit) tuples, as from
+        calculate_profit_loss; (None, None, None) where purchase_price is 0.00
+        or the current price is unknown
+    """
+    current = np.asarray(current_prices, dtype=np.float64)
+    purchase = np.asarray(purchase_prices, dtype=np.float64)
+    
+    amount_change = current - purchase
+    valid = (purchase != 0.0) & ~np.isnan(current)
+    percent_change = np.divide(amount_change, purchase, out=np.zeros_like(amount_change), where=valid) * 100
+    is_profit = amount_change >= 0
+    
+    return [
+        (percent, amount, profit) if ok else (None, None, None)
+        for percent, amount, profit, ok in zip(
+            percent_change.tolist(), amount_change.tolist(), is_profit.tolist(), valid.tolist()
+        )
+    ]
+
+
 class ProfitLossCalculator:
     """Calculator for profit/loss analysis."""
     
@@ -43,6 +85,20 @@ class ProfitLossCalculator:
         """
         return calculate_profit_loss(current_price, purchase_price)
     
+    @staticmethod
+    def calculate_batch(current_prices, purchase_prices):
+        """
+        Calculate profit/loss for a whole portfolio in one pass.
+        
+        Args:
+            current_prices: Sequence of current stock prices (NaN where unknown)
+            purchase_prices: Sequence of stock purchase prices
+        
+        Returns:
+            List of (percent_change, amount_change, is_profit) tuples
+        """
+        return calculate_profit_loss_batch(current_prices, purchase_prices)
+    
     @staticmethod
     def format_percentage(percent_change, is_profit):
         """
@@ -79,3 +135,23 @@ class ProfitLossCalculator:
         
         sign = "+" if is_profit else ""
         return f"{sign}{amount_change:.2f} {currency}"
+    
+    @staticmethod
+    def format_row(percent_change, amount_change, currency, is_profit):
+        """
+        Format the profit/loss cells of a table row in one call.
+        
+        Args:
+            percent_change: Percentage change or None
+            amount_change: Amount change or None
+            currency: Currency symbol
+            is_profit: Whether it's a profit
+        
+        Returns:
+            Tuple (percent_str, amount_str, style)
+        """
+        if percent_change is None:
+            return "-", "-", STYLE_NO_VALUE
+        
+        format_percent, format_amount, style = _ROW_FORMATS[bool(is_profit)]
+        return format_percent(percent_change), format_amount(amount_change, currency), style
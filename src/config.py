@@ -4,10 +4,53 @@ Handles loading and managing application configuration.
 """
 
 import os
-import configparser
-from rich.console import Console
+import re
+from collections import namedtuple
 
-console = Console()
+from .console import console
+
+SECTION_RE = re.compile(r'^\[([^\]]+)\]')
+KV_RE = re.compile(r'^\s*([^=;#\s][^=]*?)\s*=\s*(.*?)\s*$')
+
+# Parsed settings keyed by (config_path, mtime_ns), shared by all Config instances
+_CONFIG_CACHE = {}
+
+# Immutable snapshot of the settings with attribute access, safe to share
+ConfigView = namedtuple('ConfigView', ['refresh_interval', 'max_history', 'plot_width', 'plot_height'])
+
+
+class FastConfigParser:
+    """Minimal single-pass INI parser for the flat config.ini format."""
+    
+    @staticmethod
+    def read(path):
+        """
+        Parses INI file into nested dictionaries.
+        
+        Args:
+            path: Path to INI file
+        
+        Returns:
+            Dictionary {section: {key: value}} with string values
+        """
+        sections = {}
+        current_section = None
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line or line[0] in '#;':
+                    continue
+                
+                match = SECTION_RE.match(line)
+                if match:
+                    current_section = sections.setdefault(match.group(1).strip(), {})
+                    continue
+                
+                match = KV_RE.match(line)
+                if match and current_section is not None:
+                    current_section[match.group(1).lower()] = match.group(2)
+        
+        return sections
 
 
 class Config:
@@ -29,35 +72,50 @@ class Config:
         """
         self.config_file = config_file
         self.settings = self._load()
+        self.view = ConfigView(**self.settings)
     
     def _load(self):
         """
         Loads configuration from config.ini file.
+        Parsed settings are cached per file path and modification time,
+        so repeated construction does not re-read an unchanged file.
         
         Returns:
             Dictionary with configuration settings
         """
-        config = configparser.ConfigParser()
         config_path = os.path.join(os.path.dirname(__file__), self.config_file)
         
         if os.path.exists(config_path):
             try:
-                config.read(config_path)
-                return {
-                    'refresh_interval': config.getint('Settings', 'refresh_interval', 
-                                                     fallback=self.DEFAULT_SETTINGS['refresh_interval']),
-                    'max_history': config.getint('Settings', 'max_history', 
-                                                 fallback=self.DEFAULT_SETTINGS['max_history']),
-                    'plot_width': config.getint('Settings', 'plot_width', 
-                                                fallback=self.DEFAULT_SETTINGS['plot_width']),
-                    'plot_height': config.getint('Settings', 'plot_height', 
-                                                 fallback=self.DEFAULT_SETTINGS['plot_height'])
-                }
-            except Exception as e:
+                key = (os.path.abspath(config_path), os.stat(config_path).st_mtime_ns)
+            except OSError:
                 return self.DEFAULT_SETTINGS.copy()
+            
+            if key not in _CONFIG_CACHE:
+                _CONFIG_CACHE[key] = self._parse_uncached(config_path)
+            return _CONFIG_CACHE[key].copy()
         else:
             return self.DEFAULT_SETTINGS.copy()
     
+    def _parse_uncached(self, config_path):
+        """
+        Parses configuration file without consulting the cache.
+        
+        Args:
+            config_path: Path to configuration file
+        
+        Returns:
+            Dictionary with configuration settings
+        """
+        try:
+            settings = FastConfigParser.read(config_path).get('Settings', {})
+            return {
+                key: int(settings.get(key, default))
+                for key, default in self.DEFAULT_SETTINGS.items()
+            }
+        except Exception as e:
+            return self.DEFAULT_SETTINGS.copy()
+    
     def get(self, key, default=None):
         """Get configuration value by key."""
         return self.settings.get(key, default)
@@ -85,24 +143,25 @@ def load_stocks_from_file(filename):
     try:
         stocks = {}
         with open(filename, 'r', encoding='utf-8') as f:
-            for line in f:
-                line = line.strip()
-                if not line or line.startswith('#'):
-                    continue
-                    
-                # Check if there's a comma (format: SYMBOL,PRICE)
-                if ',' in line:
-                    parts = line.split(',')
-                    symbol = parts[0].strip().upper()
-                    try:
-                        purchase_price = float(parts[1].strip())
-                    except ValueError:
-                        purchase_price = 0.00
-                    stocks[symbol] = purchase_price
-                else:
-                    # Only symbol, purchase price = 0.00
-                    symbol = line.upper()
-                    stocks[symbol] = 0.00
+            data = f.read()
+        
+        for line in data.splitlines():
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            
+            # Format: SYMBOL,PRICE or just SYMBOL (then purchase price = 0.00)
+            # The line is already stripped, so only the symbol's right side
+            # may carry spaces; float() ignores surrounding whitespace itself
+            symbol, separator, rest = line.partition(',')
+            symbol = symbol.rstrip().upper()
+            purchase_price = 0.00
+            if separator:
+                try:
+                    purchase_price = float(rest.partition(',')[0])
+                except ValueError:
+                    purchase_price = 0.00
+            stocks[symbol] = purchase_price
         
         return stocks if stocks else None
     except FileNotFoundError:
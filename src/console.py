@@ -0,0 +1,9 @@
+"""
+Shared console for GPW Stock Monitor.
+All modules print through this one Rich Console, so terminal
+capabilities are detected only once.
+"""
+
+from rich.console import Console
+
+console = Console()
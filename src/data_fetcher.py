@@ -3,28 +3,72 @@ Data fetching module for GPW Stock Monitor.
 Handles fetching stock data from Yahoo Finance API.
 """
 
-try:
-    import yfinance as yf
-except ImportError:
-    print("Installing yfinance library...")
-    import subprocess
-    import sys
-    subprocess.check_call([sys.executable, "-m", "pip", "install", "yfinance"])
-    import yfinance as yf
+import importlib.util
+import json
+import os
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 
-from rich.console import Console
+import numpy as np
 
-console = Console()
+from .console import console
+
+
+def _lazy_import(name):
+    """
+    Import a module whose body only runs on first attribute access.
+    
+    Args:
+        name: Module name
+    
+    Returns:
+        Module object (the loaded module if it was already imported)
+    
+    Raises:
+        ImportError: If the module is not installed
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ImportError(f"No module named {name!r}", name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+# yfinance pulls in pandas and dominates import time, so it is loaded on
+# first use rather than when this module is imported
+yf = _lazy_import('yfinance')
+
+# Quotes persisted between runs so a restart can reuse recent prices
+DEFAULT_CACHE_FILE = os.path.expanduser('~/.gpw_cache.json')
+
+# Keys of yfinance info checked for a price, most current first
+_PRICE_KEYS = ('currentPrice', 'regularMarketPrice', 'previousClose')
+
+# Keys of yfinance fast_info checked for a price, most current first
+_FAST_PRICE_KEYS = ('lastPrice', 'regularMarketPreviousClose', 'previousClose')
 
 
 class StockData:
     """Represents stock data with price and metadata."""
     
-    def __init__(self, symbol, name, price, currency):
+    def __init__(self, symbol, name, price, currency, stale=False):
         self.symbol = symbol
         self.name = name
         self.price = price
         self.currency = currency
+        # True for a last-known quote served because fetching failed
+        self.stale = stale
     
     def to_dict(self):
         """Convert to dictionary format for backward compatibility."""
@@ -39,6 +83,106 @@ class StockData:
 class StockDataFetcher:
     """Fetches stock price data from Yahoo Finance."""
     
+    MAX_WORKERS = 16
+    BATCH_SIZE = 20
+    FETCH_TIMEOUT = 15
+    NETWORK_RETRIES = 2
+    METADATA_TTL = 24 * 60 * 60
+    STALE_MAX_AGE = 60 * 60
+    
+    def __init__(self, ttl=0, cache_file=None):
+        """
+        Initialize stock data fetcher.
+        
+        Args:
+            ttl: Seconds a fetched price is reused before querying again (0 disables caching)
+            cache_file: Optional JSON file used to persist quotes between runs
+        """
+        self.ttl = ttl
+        self.cache_file = cache_file
+        self._cache = {}
+        self._stale = {}
+        self._names = {}
+        self._currencies = {}
+        self._symbols = {}
+        self._lock = threading.Lock()
+        self._executor = None
+        self._pending = {}
+        
+        StockDataFetcher.configure_network(self.NETWORK_RETRIES)
+        if cache_file:
+            self._load_cache_file()
+    
+    @staticmethod
+    def configure_network(retries):
+        """
+        Configure yfinance's shared HTTP session to retry transient errors.
+        yfinance keeps a single pooled keep-alive session for all threads
+        and rejects foreign session types, so retries are enabled through
+        its own config instead of a custom session adapter.
+        
+        Args:
+            retries: Number of retries after a transient network error
+        """
+        network = getattr(getattr(yf, 'config', None), 'network', None)
+        if network is not None:
+            network.retries = retries
+    
+    def _load_cache_file(self):
+        """
+        Load quotes persisted by a previous run.
+        Quotes younger than ttl are served as fresh; those younger than
+        STALE_MAX_AGE are kept as a fallback for when Yahoo cannot be
+        reached. Company names and currencies younger than METADATA_TTL
+        are reused as well, so a warm
+        start neither requests the full info payload nor waits for the
+        first per-symbol pass before prices can be batched.
+        """
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            return
+        
+        if not isinstance(entries, dict):
+            return
+        
+        wall_now = time.time()
+        monotonic_now = time.monotonic()
+        for stock_symbol, entry in entries.items():
+            try:
+                stock_data = StockData(entry['symbol'], entry['name'], entry['price'], entry['currency'])
+                age = wall_now - entry['time']
+            except (KeyError, TypeError):
+                continue
+            
+            self._stale[stock_symbol] = (monotonic_now - age, stock_data)
+            if 0 <= age < self.ttl:
+                self._cache[stock_symbol] = (monotonic_now - age, stock_data)
+            if 0 <= age < self.METADATA_TTL and stock_data.name and stock_data.currency:
+                self._names[stock_data.symbol] = stock_data.name
+                self._currencies[stock_data.symbol] = stock_data.currency
+    
+    def save_cache_file(self):
+        """Persist the latest fetched quotes to cache_file, if configured."""
+        if not self.cache_file:
+            return
+        
+        wall_offset = time.time() - time.monotonic()
+        with self._lock:
+            entries = {
+                stock_symbol: dict(stock_data.to_dict(), time=fetched_at + wall_offset)
+                for stock_symbol, (fetched_at, stock_data) in self._cache.items()
+            }
+        
+        temp_file = f"{self.cache_file}.tmp"
+        try:
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(entries, f)
+            os.replace(temp_file, self.cache_file)
+        except OSError:
+            pass
+    
     @staticmethod
     def normalize_symbol(stock_symbol):
         """
@@ -54,10 +198,251 @@ class StockDataFetcher:
             return f"{stock_symbol}.WA"
         return stock_symbol
     
-    @staticmethod
-    def get_stock_price(stock_symbol):
+    def _resolved(self, stock_symbol):
+        """
+        Get normalized symbol, resolving each input symbol only once.
+        
+        Args:
+            stock_symbol: Stock symbol (e.g. 'PKO', 'PKNORLEN')
+        
+        Returns:
+            Normalized symbol with .WA suffix
+        """
+        symbol = self._symbols.get(stock_symbol)
+        if symbol is None:
+            symbol = self._symbols[stock_symbol] = StockDataFetcher.normalize_symbol(stock_symbol)
+        return symbol
+    
+    def _cached(self, stock_symbol, now):
+        """
+        Get cached quote if it is younger than ttl.
+        
+        Args:
+            stock_symbol: Stock symbol (e.g. 'PKO', 'PKNORLEN')
+            now: Current time.monotonic() value
+        
+        Returns:
+            StockData object or None if not cached or expired
+        """
+        with self._lock:
+            cached = self._cache.get(stock_symbol)
+        if cached and now - cached[0] < self.ttl:
+            return cached[1]
+        return None
+    
+    def _store(self, stock_symbol, stock_data, now):
+        """
+        Record a freshly fetched quote as both the cached and the last good quote.
+        
+        Args:
+            stock_symbol: Stock symbol (e.g. 'PKO', 'PKNORLEN')
+            stock_data: StockData object
+            now: time.monotonic() value of the fetch
+        """
+        with self._lock:
+            self._cache[stock_symbol] = (now, stock_data)
+            self._stale[stock_symbol] = (now, stock_data)
+    
+    def _fallback(self, stock_symbol, now):
+        """
+        Get the last good quote of a stock if it is younger than STALE_MAX_AGE.
+        
+        Args:
+            stock_symbol: Stock symbol (e.g. 'PKO', 'PKNORLEN')
+            now: Current time.monotonic() value
+        
+        Returns:
+            StockData object marked as stale or None if there is no recent quote
+        """
+        with self._lock:
+            last_good = self._stale.get(stock_symbol)
+        if not last_good or not 0 <= now - last_good[0] < self.STALE_MAX_AGE:
+            return None
+        
+        stock_data = last_good[1]
+        return StockData(stock_data.symbol, stock_data.name, stock_data.price, stock_data.currency, stale=True)
+    
+    def get_cached_currency(self, stock_symbol, default='PLN'):
+        """
+        Get the currency of a stock without a network request.
+        
+        Args:
+            stock_symbol: Stock symbol (e.g. 'PKO', 'PKNORLEN')
+            default: Currency returned if the stock has not been fetched yet
+        
+        Returns:
+            Currency code
+        """
+        return self._currencies.get(self._resolved(stock_symbol), default)
+    
+    def get_stock_price(self, stock_symbol):
+        """
+        Gets current stock price, reusing a cached result younger than ttl.
+        If fetching fails, the last good quote (fetched in this session or
+        loaded from cache_file) is returned instead, marked as stale.
+        
+        Args:
+            stock_symbol: Stock symbol (e.g. 'PKO', 'PKNORLEN')
+        
+        Returns:
+            StockData object or None in case of error
+        """
+        now = time.monotonic()
+        cached = self._cached(stock_symbol, now)
+        if cached:
+            return cached
+        
+        stock_data = self.fetch_stock_price(stock_symbol)
+        if stock_data:
+            self._store(stock_symbol, stock_data, now)
+            return stock_data
+        
+        return self._fallback(stock_symbol, now)
+    
+    def get_stock_prices(self, stock_symbols):
+        """
+        Gets current prices for many stocks at once.
+        Stocks whose name and currency are already known are priced with
+        batched downloads of BATCH_SIZE symbols; the rest (and any the batch
+        could not price) are fetched one by one, fanned out over a thread
+        pool kept for the fetcher's lifetime (yfinance shares a single HTTP
+        session between threads). Stocks not fetched within FETCH_TIMEOUT
+        seconds get their last good quote, if any; a fetch still running
+        then is waited on by the next call instead of being queued again.
+        
+        Args:
+            stock_symbols: Iterable of stock symbols
+        
+        Returns:
+            Dictionary {symbol: StockData or None}
+        """
+        stock_symbols = list(stock_symbols)
+        if not stock_symbols:
+            return {}
+        
+        now = time.monotonic()
+        results = {}
+        batchable = [
+            stock_symbol for stock_symbol in stock_symbols
+            if self._resolved(stock_symbol) in self._currencies
+            and not self._cached(stock_symbol, now)
+        ]
+        
+        for stock_symbol, price in self.download_prices(batchable).items():
+            symbol = self._resolved(stock_symbol)
+            stock_data = StockData(symbol, self._names[symbol], price, self._currencies[symbol])
+            self._store(stock_symbol, stock_data, now)
+            results[stock_symbol] = stock_data
+        
+        remaining = [stock_symbol for stock_symbol in stock_symbols if stock_symbol not in results]
+        if remaining:
+            futures = [self._submit_fetch(stock_symbol) for stock_symbol in remaining]
+            deadline = time.monotonic() + self.FETCH_TIMEOUT
+            for stock_symbol, future in zip(remaining, futures):
+                try:
+                    results[stock_symbol] = future.result(timeout=max(0, deadline - time.monotonic()))
+                except FutureTimeoutError:
+                    # Drop the fetch if it has not started yet; a running one
+                    # stays in _pending so it is not queued a second time
+                    future.cancel()
+                    results[stock_symbol] = self._fallback(stock_symbol, now)
+        
+        return {stock_symbol: results[stock_symbol] for stock_symbol in stock_symbols}
+    
+    def _submit_fetch(self, stock_symbol):
+        """
+        Submit a fetch of one stock to the thread pool unless one is still pending.
+        
+        Args:
+            stock_symbol: Stock symbol (e.g. 'PKO', 'PKNORLEN')
+        
+        Returns:
+            Future resolving to the result of get_stock_price
+        """
+        future = self._pending.get(stock_symbol)
+        if future is None or future.done():
+            future = self._get_executor().submit(self.get_stock_price, stock_symbol)
+            self._pending[stock_symbol] = future
+        return future
+    
+    def _get_executor(self):
+        """
+        Get the fetch thread pool, creating it on first use.
+        
+        Returns:
+            ThreadPoolExecutor shared by all fetches of this fetcher
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.MAX_WORKERS, thread_name_prefix='gpw_fetch'
+            )
+        return self._executor
+    
+    def close(self):
+        """Shut down the fetch thread pool without waiting for pending requests."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        self._pending.clear()
+    
+    def download_prices(self, stock_symbols):
+        """
+        Downloads latest prices for many stocks in batches of BATCH_SIZE.
+        When there is more than one batch, the batches are downloaded
+        concurrently on the fetch thread pool.
+        
+        Args:
+            stock_symbols: List of stock symbols
+        
+        Returns:
+            Dictionary {symbol: price} for the stocks that could be priced
+        """
+        chunks = [
+            stock_symbols[start:start + self.BATCH_SIZE]
+            for start in range(0, len(stock_symbols), self.BATCH_SIZE)
+        ]
+        if len(chunks) > 1:
+            chunk_prices = self._get_executor().map(self._download_chunk, chunks)
+        else:
+            chunk_prices = map(self._download_chunk, chunks)
+        
+        prices = {}
+        for result in chunk_prices:
+            prices.update(result)
+        return prices
+    
+    def _download_chunk(self, chunk):
+        """
+        Downloads latest prices for one batch of stocks.
+        
+        Args:
+            chunk: List of at most BATCH_SIZE stock symbols
+        
+        Returns:
+            Dictionary {symbol: price} for the stocks that could be priced
+        """
+        symbols = [self._resolved(stock_symbol) for stock_symbol in chunk]
+        try:
+            data = yf.download(
+                symbols, period='1d', interval='1m', group_by='ticker',
+                progress=False, threads=True
+            )
+        except Exception:
+            return {}
+        
+        prices = {}
+        for stock_symbol, symbol in zip(chunk, symbols):
+            price = StockDataFetcher._last_close(data, symbol)
+            if price:
+                prices[stock_symbol] = price
+        return prices
+    
+    def fetch_stock_price(self, stock_symbol):
         """
         Fetches current stock price from GPW.
+        Uses the lightweight fast_info quote and falls back to the full
+        info payload only for missing fields. Company names never change,
+        so they are fetched once per symbol and cached.
         
         Args:
             stock_symbol: Stock symbol (e.g. 'PKO', 'PKNORLEN')
@@ -66,18 +451,28 @@ class StockDataFetcher:
             StockData object or None in case of error
         """
         try:
-            symbol = StockDataFetcher.normalize_symbol(stock_symbol)
+            symbol = self._resolved(stock_symbol)
             
-            # Fetch stock data
+            # A fresh Ticker per fetch: Ticker caches its fast_info values,
+            # so a reused one would keep returning the first price
             stock = yf.Ticker(symbol)
-            info = stock.info
+            price, currency = StockDataFetcher._extract_fast_info(stock.fast_info)
+            full_name = self._names.get(symbol)
             
-            # Try to get current price from various sources
-            price = StockDataFetcher._extract_price(info)
+            if not price or not currency or full_name is None:
+                info = stock.info
+                
+                # Try to get current price from various sources
+                if not price:
+                    price = StockDataFetcher._extract_price(info)
+                if not currency:
+                    currency = info.get('currency', 'PLN')
+                if full_name is None:
+                    full_name = info.get('longName', info.get('shortName', stock_symbol))
+                    self._names[symbol] = full_name
             
             if price:
-                currency = info.get('currency', 'PLN')
-                full_name = info.get('longName', info.get('shortName', stock_symbol))
+                self._currencies[symbol] = currency
                 return StockData(symbol, full_name, price, currency)
             else:
                 return None
@@ -86,6 +481,52 @@ class StockDataFetcher:
             console.print(f"[red]❌ Error fetching data for {stock_symbol}: {e}[/red]")
             return None
     
+    @staticmethod
+    def _last_close(data, symbol):
+        """
+        Extract last available close price of one symbol from yf.download data.
+        
+        Args:
+            data: DataFrame returned by yf.download
+            symbol: Normalized stock symbol
+        
+        Returns:
+            Price as float or None
+        """
+        try:
+            if data.columns.nlevels > 1:
+                closes = data[symbol]['Close'].dropna()
+            else:
+                closes = data['Close'].dropna()
+            if len(closes):
+                return float(closes.iloc[-1])
+        except Exception:
+            pass
+        return None
+    
+    @staticmethod
+    def _extract_fast_info(fast_info):
+        """
+        Extract price and currency from yfinance fast_info.
+        Falls back to the previous close so the heavy info payload is
+        not needed just because the last trade price is missing.
+        
+        Args:
+            fast_info: Dict-like fast_info object from yfinance
+        
+        Returns:
+            Tuple (price, currency), with None for unavailable fields
+        """
+        try:
+            price = None
+            for key in _FAST_PRICE_KEYS:
+                price = fast_info.get(key)
+                if price:
+                    break
+            return price, fast_info.get('currency')
+        except Exception:
+            return None, None
+    
     @staticmethod
     def _extract_price(info):
         """
@@ -97,29 +538,46 @@ class StockDataFetcher:
         Returns:
             Price as float or None
         """
-        # Check various possible keys for current price
-        if 'currentPrice' in info and info['currentPrice']:
-            return info['currentPrice']
-        elif 'regularMarketPrice' in info and info['regularMarketPrice']:
-            return info['regularMarketPrice']
-        elif 'previousClose' in info and info['previousClose']:
-            console.print("[dim yellow]Note: Returning closing price from previous session[/dim yellow]")
-            return info['previousClose']
+        # Check various possible keys for current price, in priority order
+        for key in _PRICE_KEYS:
+            price = info.get(key)
+            if price:
+                if key == 'previousClose':
+                    console.print("[dim yellow]Note: Returning closing price from previous session[/dim yellow]")
+                return price
         return None
 
 
 class PriceHistory:
-    """Manages price history for stocks."""
+    """
+    Manages price history for stocks.
+    
+    Times and prices are stored as separate per-symbol structures: a
+    bounded deque of time strings and a float64 ring buffer of prices.
+    The ring buffer is twice max_history long and every price is written
+    to both halves, so the chronological window is always one contiguous
+    slice. Later writes reuse that memory, so public accessors return
+    copies of the window.
+    """
     
     def __init__(self, max_history=50):
         """
         Initialize price history manager.
         
         Args:
-            max_history: Maximum number of price points to keep
+            max_history: Maximum number of price points to keep (at least 1)
         """
-        self.max_history = max_history
-        self._history = {}
+        # The ring buffer index is taken modulo max_history
+        self.max_history = max(1, max_history)
+        self._times = {}
+        self._prices = {}
+        self._len = {}
+    
+    def _start_series(self, stock_symbol):
+        """Create empty time and price storage for a stock."""
+        self._times[stock_symbol] = deque(maxlen=self.max_history)
+        self._prices[stock_symbol] = np.empty(2 * self.max_history, dtype=np.float64)
+        self._len[stock_symbol] = 0
     
     def add(self, stock_symbol, time_str, price):
         """
@@ -130,14 +588,48 @@ class PriceHistory:
             time_str: Time string
             price: Price value
         """
-        if stock_symbol not in self._history:
-            self._history[stock_symbol] = []
+        if stock_symbol not in self._times:
+            self._start_series(stock_symbol)
+        
+        # Oldest entries are evicted automatically once max_history is reached
+        self._times[stock_symbol].append(time_str)
+        
+        count = self._len[stock_symbol]
+        slot = count % self.max_history
+        prices = self._prices[stock_symbol]
+        prices[slot] = price
+        prices[slot + self.max_history] = price
+        self._len[stock_symbol] = count + 1
+    
+    def add_bulk(self, stock_symbol, times, prices):
+        """
+        Add many price points to history at once.
+        
+        Args:
+            stock_symbol: Stock symbol
+            times: Sequence of time strings, oldest first
+            prices: Sequence or NumPy array of prices, parallel to times
+        
+        Raises:
+            ValueError: If times and prices differ in length
+        """
+        prices = np.asarray(prices, dtype=np.float64)
+        if len(times) != len(prices):
+            raise ValueError(f"Got {len(times)} times for {len(prices)} prices")
+        if stock_symbol not in self._times:
+            self._start_series(stock_symbol)
         
-        self._history[stock_symbol].append((time_str, price))
+        self._times[stock_symbol].extend(times)
         
-        # Keep only the last measurements according to config
-        if len(self._history[stock_symbol]) > self.max_history:
-            self._history[stock_symbol].pop(0)
+        # Only the newest max_history prices survive; write them in one pass
+        count = self._len[stock_symbol]
+        added = len(prices)
+        kept = prices[-self.max_history:]
+        slots = (count + added - len(kept) + np.arange(len(kept))) % self.max_history
+        buffer = self._prices[stock_symbol]
+        buffer[slots] = kept
+        buffer[slots + self.max_history] = kept
+        self._len[stock_symbol] = count + added
     
     def get(self, stock_symbol):
         """
@@ -149,7 +641,91 @@ class PriceHistory:
         Returns:
             List of (time, price) tuples
         """
-        return self._history.get(stock_symbol, [])
+        return list(zip(self.get_times(stock_symbol), self._prices_window(stock_symbol).tolist()))
+    
+    def snapshot(self, stock_symbol):
+        """
+        Get times and prices of the price history for a stock as parallel sequences.
+        
+        Args:
+            stock_symbol: Stock symbol
+        
+        Returns:
+            Tuple (list of time strings, float64 NumPy array of prices), oldest first
+        """
+        return self.get_times(stock_symbol), self.get_prices(stock_symbol)
+    
+    def get_times(self, stock_symbol):
+        """
+        Get time strings of the price history for a stock.
+        
+        Args:
+            stock_symbol: Stock symbol
+        
+        Returns:
+            List of time strings, oldest first
+        """
+        return list(self._times.get(stock_symbol, ()))
+    
+    def get_prices(self, stock_symbol):
+        """
+        Get prices of the price history for a stock.
+        
+        Args:
+            stock_symbol: Stock symbol
+        
+        Returns:
+            float64 NumPy array, oldest first (a copy, unaffected by later adds)
+        """
+        return self._prices_window(stock_symbol).copy()
+    
+    def _prices_window(self, stock_symbol):
+        """
+        Get the chronological window of the ring buffer of a stock.
+        
+        Args:
+            stock_symbol: Stock symbol
+        
+        Returns:
+            float64 NumPy array view, oldest first (overwritten by later adds)
+        """
+        if stock_symbol not in self._prices:
+            return np.empty(0, dtype=np.float64)
+        
+        count = self._len[stock_symbol]
+        size = min(count, self.max_history)
+        start = (count - size) % self.max_history
+        return self._prices[stock_symbol][start:start + size]
+    
+    def get_prices_view(self, stock_symbol):
+        """
+        Get prices of the price history for a stock as a buffer.
+        
+        Args:
+            stock_symbol: Stock symbol
+        
+        Returns:
+            Read-only memoryview of float64 prices, oldest first (unaffected by later adds)
+        """
+        return memoryview(self.get_prices(stock_symbol)).toreadonly()
+    
+    def sample_count(self, stock_symbol):
+        """
+        Get the number of price points ever added for a stock.
+        
+        Args:
+            stock_symbol: Stock symbol
+        
+        Returns:
+            Count that grows with every added point, including evicted ones
+        """
+        return self._len.get(stock_symbol, 0)
+    
+    def clear(self):
+        """Remove the price history of all stocks."""
+        self._times.clear()
+        self._prices.clear()
+        self._len.clear()
     
     def has_enough_data(self, stock_symbol, min_points=2):
         """
@@ -162,8 +738,8 @@ class PriceHistory:
         Returns:
             True if enough data exists
         """
-        return len(self.get(stock_symbol)) >= min_points
+        return len(self._times.get(stock_symbol, ())) >= min_points
     
     def __contains__(self, stock_symbol):
         """Support 'in' operator."""
-        return stock_symbol in self._history
+        return stock_symbol in self._times
@@ -6,37 +6,31 @@ Example: python gpw_kurs.py akcje.txt
 Program checks prices every configurable interval and displays them on screen.
 """
 
+import signal
 import sys
 import time
 from datetime import datetime
 
 # Import local modules
 from .config import Config, load_stocks_from_file
-from .data_fetcher import StockDataFetcher, PriceHistory
-from .input_handler import NavigationHandler, InputAction, check_key_nonblocking, wait_for_escape
+from .input_handler import NavigationHandler, InputAction, KeyReader, check_key_nonblocking, wait_for_escape
 from .ui_display import UIDisplay, StockTableBuilder, ChartDisplay
-from .calculations import calculate_profit_loss
+from .calculations import calculate_profit_loss_batch
+from .console import console
 
 # Import Rich components
-try:
-    from rich.console import Console, Group
-    from rich.live import Live
-except ImportError:
-    print("Installing rich library...")
-    import subprocess
-    subprocess.check_call([sys.executable, "-m", "pip", "install", "rich"])
-    from rich.console import Console, Group
-    from rich.live import Live
-
-# Initialize Rich console
-console = Console()
+from rich.console import Group
 
 
-def build_stock_table(stocks, navigation, fetcher, history, last_stock_data, time_str, time_full, fetch_new_data=True):
+def update_stock_table(table, stocks, navigation, fetcher, history, last_stock_data, time_str, time_full, fetch_new_data=True):
     """
-    Build stock table with current data.
+    Update stock table with current data.
+    Rows are appended on the first call and replaced in place afterwards,
+    so the table and its columns are allocated only once. Existing rows
+    whose quote did not change are left untouched.
     
     Args:
+        table: Rich Table object created by StockTableBuilder.create_table
         stocks: Dictionary of stock symbols and purchase prices
         navigation: NavigationHandler instance
         fetcher: StockDataFetcher instance
@@ -49,27 +43,62 @@ def build_stock_table(stocks, navigation, fetcher, history, last_stock_data, tim
     Returns:
         Rich Table object
     """
-    table = StockTableBuilder.create_table(f"📊 Stock Prices Update - {time_full}")
+    table.title = f"📊 Stock Prices Update - {time_full}"
+    row_count = len(table.rows)
     
-    for row_index, (stock_symbol, purchase_price) in enumerate(stocks.items()):
-        is_selected = (row_index == navigation.get_selected_index())
-        
-        if fetch_new_data:
-            stock_data = fetcher.get_stock_price(stock_symbol)
+    # Materialize the stock list once and reuse it for every pass below
+    stock_items = list(stocks.items())
+    stock_symbols = [stock_symbol for stock_symbol, _ in stock_items]
+    
+    changed = set()
+    if fetch_new_data:
+        fetched = fetcher.get_stock_prices(stock_symbols)
+        add_to_history = history.add
+        for stock_symbol in stock_symbols:
+            stock_data = fetched.get(stock_symbol)
             if stock_data:
-                last_stock_data[stock_symbol] = stock_data.to_dict()
-                history.add(stock_symbol, time_str, stock_data.price)
+                stock_info = stock_data.to_dict()
+                if last_stock_data.get(stock_symbol) != stock_info:
+                    changed.add(stock_symbol)
+                    last_stock_data[stock_symbol] = stock_info
+                # A last-known quote is shown but not recorded as a new price point
+                if not stock_data.stale:
+                    add_to_history(stock_symbol, time_str, stock_data.price)
+    
+    # Profit/loss of all stocks in one vectorized pass
+    current_prices = [
+        last_stock_data[stock_symbol]['price'] if stock_symbol in last_stock_data else float('nan')
+        for stock_symbol in stock_symbols
+    ]
+    profit_losses = calculate_profit_loss_batch(current_prices, [purchase_price for _, purchase_price in stock_items])
+    
+    selected_index = navigation.get_selected_index()
+    for row_index, ((stock_symbol, purchase_price), profit_loss) in enumerate(zip(stock_items, profit_losses)):
+        # The row already shows this data; selection is kept by set_row_selected
+        if row_index < row_count and stock_symbol not in changed:
+            continue
+        
+        is_selected = (row_index == selected_index)
+        stock_info = last_stock_data.get(stock_symbol)
         
-        if stock_symbol in last_stock_data:
-            stock_info = last_stock_data[stock_symbol]
-            profit_loss = calculate_profit_loss(stock_info['price'], purchase_price)
-            StockTableBuilder.add_stock_row(table, stock_info, purchase_price, profit_loss, is_selected)
+        if stock_info is not None:
+            if row_index < row_count:
+                StockTableBuilder.update_stock_row(table, row_index, stock_info, purchase_price, profit_loss, is_selected)
+            else:
+                StockTableBuilder.add_stock_row(table, stock_info, purchase_price, profit_loss, is_selected)
+        elif row_index < row_count:
+            StockTableBuilder.update_error_row(table, row_index, stock_symbol, is_selected)
         else:
             StockTableBuilder.add_error_row(table, stock_symbol, is_selected)
     
     return table
 
 
+def _stop_on_sigterm(signum, frame):
+    """End the session on SIGTERM (e.g. docker stop) the same way as Ctrl+C."""
+    raise KeyboardInterrupt
+
+
 def main():
     """Main application loop."""
     if len(sys.argv) != 2:
@@ -83,7 +112,8 @@ def main():
     
     # Load configuration
     config = Config()
-    refresh_interval = config['refresh_interval']
+    settings = config.view
+    refresh_interval = settings.refresh_interval
     
     # Load stocks
     stocks = load_stocks_from_file(stocks_file)
@@ -98,66 +128,78 @@ def main():
     
     UIDisplay.show_loading_info(stocks_file, stocks, refresh_interval)
     
+    # yfinance pulls in pandas and dominates start-up time, so it is only
+    # imported once the arguments and the stocks file have been validated
+    from .data_fetcher import StockDataFetcher, PriceHistory, DEFAULT_CACHE_FILE
+    
     # Initialize components
-    history = PriceHistory(max_history=config['max_history'])
+    history = PriceHistory(max_history=settings.max_history)
     navigation = NavigationHandler(list(stocks.keys()))
-    fetcher = StockDataFetcher()
+    fetcher = StockDataFetcher(ttl=max(0, refresh_interval - 1), cache_file=DEFAULT_CACHE_FILE)
+    
+    # Live display is only needed once monitoring starts, so import it lazily
+    from rich.live import Live
     
     # Clear screen once at the start
     UIDisplay.clear_and_home()
     
+    signal.signal(signal.SIGTERM, _stop_on_sigterm)
+    
     try:
-        with Live(console=console, refresh_per_second=30, screen=True) as live:
-            next_update_time = time.time() + refresh_interval
-            current_table = None
-            last_action_time = time.time()
+        # The terminal stays in raw mode for the whole session. The display is
+        # redrawn only when its content changes, so Live's refresh thread is off
+        with KeyReader() as key_reader, Live(console=console, auto_refresh=False, screen=True) as live:
+            # Scheduling uses the monotonic clock, immune to wall-clock jumps
+            next_update_time = time.monotonic() + refresh_interval
+            current_table = StockTableBuilder.create_table("📊 Stock Prices Update")
             last_stock_data = {}  # Store last fetched stock data for navigation
+            keyboard_help = UIDisplay.create_keyboard_help()
+            progress_bar = None
+            last_second = None
+            needs_render = True
             
             while True:
-                now = time.time()
+                now = time.monotonic()
                 
                 # Check if it's time to refresh data
-                if now >= next_update_time or current_table is None:
-                    current_time = datetime.now()
-                    time_str = current_time.strftime("%H:%M:%S")
-                    time_full = current_time.strftime("%Y-%m-%d %H:%M:%S")
+                if now >= next_update_time or not current_table.rows:
+                    time_full = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                    time_str = time_full[11:]
                     
-                    # Fetch new data and build table
-                    current_table = build_stock_table(
-                        stocks, navigation, fetcher, history, 
-                        last_stock_data, time_str, time_full, 
+                    # Fetch new data and update table rows in place
+                    update_stock_table(
+                        current_table, stocks, navigation, fetcher, history,
+                        last_stock_data, time_str, time_full,
                         fetch_new_data=True
                     )
                     
                     next_update_time = now + refresh_interval
+                    needs_render = True
                 
                 # Calculate remaining time for progress bar
                 remaining_time = max(0, next_update_time - now)
                 
-                # Create progress bar and keyboard help
-                progress_bar = UIDisplay.create_refresh_progress_bar(remaining_time, refresh_interval)
-                keyboard_help = UIDisplay.create_keyboard_help()
+                # The countdown shows whole seconds, so rebuild it once per second
+                if int(remaining_time) != last_second:
+                    last_second = int(remaining_time)
+                    progress_bar = UIDisplay.create_refresh_progress_bar(remaining_time, refresh_interval)
+                    needs_render = True
                 
-                # Combine table, progress bar and keyboard help
-                display_group = Group(current_table, progress_bar, keyboard_help)
+                # Re-render only when the table, countdown or selection changed
+                if needs_render:
+                    display_group = Group(current_table, progress_bar, keyboard_help)
+                    live.update(display_group, refresh=True)
+                    needs_render = False
                 
-                # Update live display
-                live.update(display_group)
-                
-                # Check for key press (non-blocking)
-                action = check_key_nonblocking(navigation)
+                # Sleep until a key arrives or the countdown ticks to the next second
+                previous_index = navigation.get_selected_index()
+                action = check_key_nonblocking(navigation, remaining_time % 1, key_reader)
                 
                 if action == InputAction.NAVIGATE_UP or action == InputAction.NAVIGATE_DOWN:
-                    # Rebuild table with new selection immediately (no fetch)
-                    current_time = datetime.now()
-                    time_str = current_time.strftime("%H:%M:%S")
-                    time_full = current_time.strftime("%Y-%m-%d %H:%M:%S")
-                    
-                    current_table = build_stock_table(
-                        stocks, navigation, fetcher, history,
-                        last_stock_data, time_str, time_full,
-                        fetch_new_data=False
-                    )
+                    # Only the previously and newly selected rows change
+                    StockTableBuilder.set_row_selected(current_table, previous_index, False)
+                    StockTableBuilder.set_row_selected(current_table, navigation.get_selected_index(), True)
+                    needs_render = True
                 
                 elif action == InputAction.SHOW_CHART:
                     live.stop()
@@ -166,20 +208,22 @@ def main():
                     if history.has_enough_data(selected_stock):
                         UIDisplay.clear()
                         
-                        # Get currency from last read
-                        stock_data = fetcher.get_stock_price(selected_stock)
-                        currency = stock_data.currency if stock_data else 'PLN'
+                        # Currency is known from the last fetch, no request needed
+                        currency = fetcher.get_cached_currency(selected_stock)
                         
-                        ChartDisplay.draw_chart(
-                            history.get(selected_stock), 
+                        times, prices = history.snapshot(selected_stock)
+                        ChartDisplay.draw_chart_arr(
+                            times,
+                            prices,
                             selected_stock, 
-                            config, 
-                            currency
+                            settings, 
+                            currency,
+                            history.sample_count(selected_stock)
                         )
                         console.print()
                         
                         # Wait for ESC to return
-                        wait_for_escape()
+                        wait_for_escape(key_reader)
                         UIDisplay.clear_and_home()
                     else:
                         UIDisplay.show_warning("Not enough data to show chart yet.")
@@ -187,10 +231,15 @@ def main():
                         UIDisplay.clear_and_home()
                     
                     live.start()
+                    needs_render = True
             
     except KeyboardInterrupt:
         UIDisplay.show_goodbye()
         sys.exit(0)
+    finally:
+        fetcher.close()
+        # Quotes are persisted once on exit, keeping file I/O out of the refresh loop
+        fetcher.save_cache_file()
 
 
 if __name__ == "__main__":
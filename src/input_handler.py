@@ -3,14 +3,24 @@ Input handling module for GPW Stock Monitor.
 Handles keyboard input and terminal control.
 """
 
+import os
 import sys
+import atexit
 import select
+import selectors
 import tty
 import termios
 import time
-from rich.console import Console
 
-console = Console()
+from .console import console
+
+# Byte sequences of keys read in one go, arrow keys translated to 'w'/'s'
+_KEY_SEQUENCES = {
+    b'\x1b[A': 'w',
+    b'\x1b[B': 's',
+    b'\x1bOA': 'w',
+    b'\x1bOB': 's',
+}
 
 
 class InputAction:
@@ -22,9 +32,26 @@ class InputAction:
     ESCAPE = 'escape'
 
 
+# Keys handled by the stock table, resolved with a single dict lookup
+_KEY_ACTIONS = {
+    'w': InputAction.NAVIGATE_UP,
+    'W': InputAction.NAVIGATE_UP,
+    's': InputAction.NAVIGATE_DOWN,
+    'S': InputAction.NAVIGATE_DOWN,
+    '\r': InputAction.SHOW_CHART,
+    '\n': InputAction.SHOW_CHART,
+}
+
+
 class TerminalInput:
     """Handles terminal input in raw mode."""
     
+    # Seconds to wait for the rest of an escape sequence split across reads
+    ESCAPE_TIMEOUT = 0.1
+    
+    # Bytes read from stdin but not yet decoded into keys
+    _pending = bytearray()
+    
     @staticmethod
     def _set_raw_mode():
         """Set terminal to raw mode and return old settings."""
@@ -33,9 +60,14 @@ class TerminalInput:
         return old_settings
     
     @staticmethod
-    def _restore_terminal(old_settings):
+    def _restore_terminal(old_settings, when=termios.TCSADRAIN):
         """Restore terminal to previous settings."""
-        termios.tcsetattr(sys.stdin, termios.TCSADRAIN, old_settings)
+        termios.tcsetattr(sys.stdin, when, old_settings)
+    
+    @staticmethod
+    def has_pending_key():
+        """Check whether keys already read from stdin are waiting to be decoded."""
+        return bool(TerminalInput._pending)
     
     @staticmethod
     def read_key_with_timeout(timeout_seconds):
@@ -48,23 +80,125 @@ class TerminalInput:
         Returns:
             Key character or None if timeout
         """
-        if select.select([sys.stdin], [], [], timeout_seconds)[0]:
-            key = sys.stdin.read(1)
-            
-            # Handle escape sequences (arrow keys)
-            if key == '\x1b':
-                if select.select([sys.stdin], [], [], 0.1)[0]:
-                    next_char = sys.stdin.read(1)
-                    if next_char == '[':
-                        if select.select([sys.stdin], [], [], 0.1)[0]:
-                            arrow = sys.stdin.read(1)
-                            if arrow == 'A':  # Up arrow
-                                return 'w'
-                            elif arrow == 'B':  # Down arrow
-                                return 's'
-                return '\x1b'  # Just ESC
+        if TerminalInput._pending or select.select([sys.stdin], [], [], timeout_seconds)[0]:
+            return TerminalInput.read_available_key()
+        return None
+    
+    @staticmethod
+    def read_available_key():
+        """
+        Read a single key once stdin is known to be readable.
+        Up to 8 bytes are taken with one os.read and decoded one key at a
+        time, so keys that arrive together (key repeat, fast typing) are
+        returned by the following calls instead of being dropped.
+        
+        Returns:
+            Key character, with arrow keys translated to 'w'/'s', or None at end of input
+        """
+        if not TerminalInput._pending and not TerminalInput._read_more(None):
+            return None
+        return TerminalInput._decode_key()
+    
+    @staticmethod
+    def _read_more(timeout_seconds):
+        """
+        Append available stdin bytes to the pending buffer.
+        
+        Args:
+            timeout_seconds: Time to wait for input, or None if stdin is known to be readable
+        
+        Returns:
+            True if any bytes were read
+        """
+        if timeout_seconds is not None and not select.select([sys.stdin], [], [], timeout_seconds)[0]:
+            return False
+        data = os.read(sys.stdin.fileno(), 8)
+        TerminalInput._pending += data
+        return bool(data)
+    
+    @staticmethod
+    def _decode_key():
+        """
+        Remove one key from the front of the pending buffer.
+        
+        Returns:
+            Key character, with arrow keys translated to 'w'/'s'
+        """
+        pending = TerminalInput._pending
+        if pending[0] != 0x1b:
+            key = chr(pending[0])
+            del pending[:1]
             return key
+        
+        # The rest of an escape sequence may follow in a separate read
+        if len(pending) < 3 and pending[1:2] in (b'', b'[', b'O'):
+            while len(pending) < 3 and TerminalInput._read_more(TerminalInput.ESCAPE_TIMEOUT):
+                pass
+        
+        if pending[1:2] == b'O' and len(pending) >= 3:
+            length = 3
+        elif pending[1:2] == b'[':
+            # CSI sequences end with a byte in the range '@'..'~'
+            length = next((i + 1 for i in range(2, len(pending)) if 0x40 <= pending[i] <= 0x7e), len(pending))
+        else:
+            length = 1
+        
+        sequence = bytes(pending[:length])
+        del pending[:length]
+        # Unknown sequences (e.g. other arrows) read as ESC
+        return _KEY_SEQUENCES.get(sequence, '\x1b')
+
+
+class KeyReader:
+    """
+    Reads keys from a terminal kept in raw mode for the reader's lifetime.
+    
+    Terminal settings are switched once on creation and restored by close()
+    (or at interpreter exit), instead of a tcgetattr/tcsetattr pair around
+    every key check. stdin is registered with a selector once. Can be used
+    as a context manager.
+    """
+    
+    def __init__(self):
+        """Switch the terminal to raw mode and start watching stdin."""
+        self._old_settings = TerminalInput._set_raw_mode()
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(sys.stdin, selectors.EVENT_READ)
+        atexit.register(self.close)
+    
+    def read_key(self, timeout_seconds):
+        """
+        Read a single key with timeout.
+        
+        Args:
+            timeout_seconds: Timeout in seconds
+        
+        Returns:
+            Key character or None if timeout
+        """
+        if self._selector is None:
+            return None
+        if TerminalInput.has_pending_key() or self._selector.select(timeout_seconds):
+            return TerminalInput.read_available_key()
         return None
+    
+    def close(self):
+        """Restore the terminal settings; safe to call more than once."""
+        if self._selector is None:
+            return
+        self._selector.close()
+        self._selector = None
+        # Nothing is left to draw, so there is no output to wait for
+        TerminalInput._restore_terminal(self._old_settings, termios.TCSANOW)
+        atexit.unregister(self.close)
+    
+    def __enter__(self):
+        """Support 'with' statement."""
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Restore the terminal when leaving the 'with' block."""
+        self.close()
 
 
 class NavigationHandler:
@@ -97,51 +231,89 @@ class NavigationHandler:
         return self.selected_index
 
 
-def check_key_nonblocking(navigation_handler):
+def check_key_nonblocking(navigation_handler, timeout=0.01, key_reader=None):
     """
-    Check for key press without blocking. Returns immediately.
+    Check for key press, waiting at most timeout seconds.
+    Returns as soon as a key arrives, so the caller can sleep in here
+    until its next scheduled redraw instead of polling.
     
     Args:
         navigation_handler: NavigationHandler instance
+        timeout: Maximum time to wait for a key in seconds
+        key_reader: Optional KeyReader; without one the terminal is
+            switched to raw mode for the duration of this call
     
     Returns:
         InputAction constant or None if no key pressed
     """
+    if key_reader is not None:
+        return _key_action(navigation_handler, key_reader.read_key(timeout))
+    
     old_settings = TerminalInput._set_raw_mode()
     
     try:
-        key = TerminalInput.read_key_with_timeout(0.01)
-        
-        if key:
-            if key.lower() == 'w':  # Move up
-                navigation_handler.move_up()
-                return InputAction.NAVIGATE_UP
-            elif key.lower() == 's':  # Move down
-                navigation_handler.move_down()
-                return InputAction.NAVIGATE_DOWN
-            elif key == '\r' or key == '\n':  # Enter
-                return InputAction.SHOW_CHART
-        
-        return None
+        return _key_action(navigation_handler, TerminalInput.read_key_with_timeout(timeout))
     finally:
         TerminalInput._restore_terminal(old_settings)
 
 
-def wait_for_escape():
+def _key_action(navigation_handler, key):
+    """
+    Apply a key press to navigation.
+    
+    Args:
+        navigation_handler: NavigationHandler instance
+        key: Key character or None
+    
+    Returns:
+        InputAction constant or None if the key has no action
+    """
+    action = _KEY_ACTIONS.get(key)
+    if action == InputAction.NAVIGATE_UP:
+        navigation_handler.move_up()
+    elif action == InputAction.NAVIGATE_DOWN:
+        navigation_handler.move_down()
+    return action
+
+
+def wait_for_escape(key_reader=None):
     """
     Waits for ESC key press to return to table view.
     
+    Args:
+        key_reader: Optional KeyReader; without one the terminal is
+            switched to raw mode for the duration of this call
+    
     Returns:
-        True when ESC is pressed
+        True when ESC is pressed, False if input ends first
     """
+    console.print("[dim]Press ESC to return to table view...[/dim]")
+    
+    if key_reader is not None:
+        return _read_until_escape(key_reader.read_key)
+    
     old_settings = TerminalInput._set_raw_mode()
     
     try:
-        console.print("[dim]Press ESC to return to table view...[/dim]")
-        
-        while True:
-            key = TerminalInput.read_key_with_timeout(0.5)
-            if key == '\x1b':  # ESC
-                return True
+        return _read_until_escape(TerminalInput.read_key_with_timeout)
     finally:
         TerminalInput._restore_terminal(old_settings)
+
+
+def _read_until_escape(read_key):
+    """
+    Read keys until ESC arrives.
+    
+    Args:
+        read_key: Function reading one key, called with no timeout
+    
+    Returns:
+        True when ESC is pressed, False if input ends first
+    """
+    while True:
+        key = read_key(None)
+        # With no timeout, None means end of input or a closed reader
+        if key is None:
+            return False
+        if key == '\x1b':  # ESC
+            return True
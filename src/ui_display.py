@@ -3,14 +3,119 @@ UI Display module for GPW Stock Monitor.
 Handles all UI rendering including tables and charts.
 """
 
-from rich.console import Console
+import functools
+import os
+import sys
+
+import numpy as np
+from rich.console import Group
 from rich.table import Table
 from rich.panel import Panel
 from rich.align import Align
 from rich.text import Text
 from rich import box
 
-console = Console()
+from .calculations import ProfitLossCalculator
+from .console import console
+
+# Prefix of the symbol cell in the currently selected table row
+SELECTION_MARKER = "→ "
+
+# Cell format template, bound once instead of rebuilt per row
+_FMT_PRICE = "{:.2f}".format
+
+# Table symbols without the .WA suffix: {symbol: display symbol}
+_SYMBOL_DISPLAY = {}
+
+# Company name cells truncated to the column width: {name: Text}
+_NAME_CELLS = {}
+
+# Styled cells are Text objects, which Rich renders without parsing markup
+_CELL_NO_VALUE = Text("-", style="dim")
+_CELL_ERROR = Text("ERROR", style="red")
+_CELL_FETCH_FAILED = Text("Failed to fetch price", style="red")
+
+# Chart block characters by eighths filled (from bottom to top)
+_CHART_BLOCKS = np.array([' ', '▁', '▂', '▃', '▄', '▅', '▆', '▇', '█'])
+
+
+def _short_symbol(symbol):
+    """
+    Get a stock symbol without the .WA suffix, stripping each symbol only once.
+    
+    Args:
+        symbol: Stock symbol (e.g. 'PKO.WA')
+    
+    Returns:
+        Display symbol (e.g. 'PKO')
+    """
+    short = _SYMBOL_DISPLAY.get(symbol)
+    if short is None:
+        short = _SYMBOL_DISPLAY[symbol] = symbol.replace('.WA', '')
+    return short
+
+
+@functools.lru_cache(maxsize=32)
+def _resample_indices(length, width):
+    """
+    Get indices of the samples kept when fitting a series into chart columns.
+    Memoized, since successive charts usually share the same length and width.
+    
+    Args:
+        length: Number of samples in the series
+        width: Number of chart columns
+    
+    Returns:
+        Read-only NumPy array of sample indices
+    """
+    indices = (np.arange(width) * (length / width)).astype(np.intp)
+    indices.flags.writeable = False
+    return indices
+
+
+def _lttb_indices(values, threshold):
+    """
+    Select samples with Largest-Triangle-Three-Buckets downsampling.
+    Unlike plain striding, LTTB keeps the peaks and troughs that give the
+    series its visual shape.
+    
+    Args:
+        values: NumPy array of samples
+        threshold: Number of samples to keep
+    
+    Returns:
+        NumPy array of indices of the kept samples, in order
+    """
+    length = len(values)
+    if threshold >= length:
+        return np.arange(length)
+    if threshold < 3:
+        return _resample_indices(length, threshold)
+    
+    # First and last samples are always kept; the rest is split into buckets
+    edges = np.append(_resample_indices(length - 2, threshold - 2) + 1, length - 1)
+    selected = np.empty(threshold, dtype=np.intp)
+    selected[0] = 0
+    selected[-1] = length - 1
+    
+    anchor = 0
+    for bucket in range(threshold - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        next_end = edges[bucket + 2] if bucket + 2 < len(edges) else length
+        
+        # Pick the point forming the largest triangle with the previous pick
+        # and the average of the next bucket
+        avg_x = (end + next_end - 1) / 2
+        avg_y = values[end:next_end].mean()
+        xs = np.arange(start, end)
+        areas = np.abs(
+            (anchor - avg_x) * (values[start:end] - values[anchor])
+            - (anchor - xs) * (avg_y - values[anchor])
+        )
+        anchor = start + int(areas.argmax())
+        selected[bucket + 1] = anchor
+    
+    return selected
 
 
 class StockTableBuilder:
@@ -54,72 +159,169 @@ class StockTableBuilder:
         
         Args:
             table: Rich Table object
-            stock_data: StockData object or dict
+            stock_data: Stock data dict, as from StockData.to_dict()
             purchase_price: Purchase price
             profit_loss: Tuple (percent, amount, is_profit) or (None, None, None)
             is_selected: Whether this row is selected
         """
-        # Handle both StockData objects and dicts
-        if hasattr(stock_data, 'to_dict'):
-            data = stock_data.to_dict()
-        else:
-            data = stock_data
+        cells = StockTableBuilder._stock_row_cells(stock_data, profit_loss, is_selected)
+        table.add_row(*cells, style="bold" if is_selected else None)
+    
+    @staticmethod
+    def add_error_row(table, stock_symbol, is_selected=False):
+        """
+        Add an error row to the table.
         
-        symbol_display = data['symbol'].replace('.WA', '')
+        Args:
+            table: Rich Table object
+            stock_symbol: Stock symbol
+            is_selected: Whether this row is selected
+        """
+        cells = StockTableBuilder._error_row_cells(stock_symbol, is_selected)
+        table.add_row(*cells, style="bold" if is_selected else None)
+    
+    @staticmethod
+    def update_stock_row(table, row_index, stock_data, purchase_price, profit_loss, is_selected=False):
+        """
+        Replace an existing row of the table with stock data.
+        
+        Args:
+            table: Rich Table object
+            row_index: Index of the row to replace
+            stock_data: Stock data dict, as from StockData.to_dict()
+            purchase_price: Purchase price
+            profit_loss: Tuple (percent, amount, is_profit) or (None, None, None)
+            is_selected: Whether this row is selected
+        """
+        cells = StockTableBuilder._stock_row_cells(stock_data, profit_loss, is_selected)
+        StockTableBuilder.update_row(table, row_index, cells, is_selected)
+    
+    @staticmethod
+    def update_error_row(table, row_index, stock_symbol, is_selected=False):
+        """
+        Replace an existing row of the table with an error row.
+        
+        Args:
+            table: Rich Table object
+            row_index: Index of the row to replace
+            stock_symbol: Stock symbol
+            is_selected: Whether this row is selected
+        """
+        cells = StockTableBuilder._error_row_cells(stock_symbol, is_selected)
+        StockTableBuilder.update_row(table, row_index, cells, is_selected)
+    
+    @staticmethod
+    def update_row(table, row_index, cells, is_selected=False):
+        """
+        Replace cells of an existing row in place, without reallocating the table.
+        
+        Args:
+            table: Rich Table object
+            row_index: Index of the row to replace
+            cells: Renderables for each column
+            is_selected: Whether this row is selected
+        """
+        for column, cell in zip(table.columns, cells):
+            column._cells[row_index] = cell
+        table.rows[row_index].style = "bold" if is_selected else None
+    
+    @staticmethod
+    def _stock_row_cells(stock_data, profit_loss, is_selected):
+        """
+        Build cells of a stock row.
+        
+        Args:
+            stock_data: Stock data dict, as from StockData.to_dict()
+            profit_loss: Tuple (percent, amount, is_profit) or (None, None, None)
+            is_selected: Whether this row is selected
+        
+        Returns:
+            List of cell renderables
+        """
+        # Callers pass the dict kept per stock; each field is read once
+        symbol, price, currency, name = (
+            stock_data['symbol'], stock_data['price'], stock_data['currency'], stock_data['name']
+        )
+        
+        symbol_display = _short_symbol(symbol)
         if is_selected:
-            symbol_display = f"→ {symbol_display}"
+            symbol_display = f"{SELECTION_MARKER}{symbol_display}"
+        
+        name_cell = _NAME_CELLS.get(name)
+        if name_cell is None:
+            name_cell = _NAME_CELLS[name] = Text(name[:30])
         
         # Format profit/loss
         percent, amount, is_profit = profit_loss
         if percent is not None:
-            if is_profit:
-                pl_percent = f"[green]+{percent:.2f}%[/green]"
-                pl_amount = f"[green]+{amount:.2f} {data['currency']}[/green]"
-            else:
-                pl_percent = f"[red]{percent:.2f}%[/red]"
-                pl_amount = f"[red]{amount:.2f} {data['currency']}[/red]"
+            percent_str, amount_str, style = ProfitLossCalculator.format_row(percent, amount, currency, is_profit)
+            pl_percent = Text(percent_str, style=style)
+            pl_amount = Text(amount_str, style=style)
         else:
-            pl_percent = "[dim]-[/dim]"
-            pl_amount = "[dim]-[/dim]"
+            pl_percent = _CELL_NO_VALUE
+            pl_amount = _CELL_NO_VALUE
         
-        table.add_row(
+        return [
             symbol_display,
-            f"{data['price']:.2f}",
-            data['currency'],
-            data['name'][:30],
+            _FMT_PRICE(price),
+            currency,
+            name_cell,
             pl_percent,
-            pl_amount,
-            style="bold" if is_selected else None
-        )
+            pl_amount
+        ]
     
     @staticmethod
-    def add_error_row(table, stock_symbol, is_selected=False):
+    def _error_row_cells(stock_symbol, is_selected):
         """
-        Add an error row to the table.
+        Build cells of an error row.
         
         Args:
-            table: Rich Table object
             stock_symbol: Stock symbol
             is_selected: Whether this row is selected
+        
+        Returns:
+            List of cell renderables
         """
         symbol_display = stock_symbol
         if is_selected:
-            symbol_display = f"→ {symbol_display}"
+            symbol_display = f"{SELECTION_MARKER}{symbol_display}"
         
-        table.add_row(
+        return [
             symbol_display,
-            "[red]ERROR[/red]",
+            _CELL_ERROR,
             "-",
-            "[red]Failed to fetch price[/red]",
-            "[dim]-[/dim]",
-            "[dim]-[/dim]",
-            style="bold" if is_selected else None
-        )
+            _CELL_FETCH_FAILED,
+            _CELL_NO_VALUE,
+            _CELL_NO_VALUE
+        ]
+    
+    @staticmethod
+    def set_row_selected(table, row_index, is_selected):
+        """
+        Mark or unmark an existing row as selected without rebuilding the table.
+        
+        Args:
+            table: Rich Table object
+            row_index: Index of the row to update
+            is_selected: Whether this row is selected
+        """
+        cells = table.columns[0]._cells
+        symbol_display = cells[row_index]
+        if symbol_display.startswith(SELECTION_MARKER):
+            symbol_display = symbol_display[len(SELECTION_MARKER):]
+        if is_selected:
+            symbol_display = f"{SELECTION_MARKER}{symbol_display}"
+        
+        cells[row_index] = symbol_display
+        table.rows[row_index].style = "bold" if is_selected else None
 
 
 class ChartDisplay:
     """Displays stock price charts using Rich Unicode blocks."""
     
+    # Last rendered chart per stock: {symbol: (history key, Group)}
+    _chart_cache = {}
+    
     @staticmethod
     def draw_chart(price_history, stock_symbol, config, currency='PLN'):
         """
@@ -128,92 +330,131 @@ class ChartDisplay:
         Args:
             price_history: List with data (time, price)
             stock_symbol: Stock symbol
-            config: Config object or dictionary
+            config: Config object, ConfigView or dictionary
+            currency: Price currency
+        """
+        if price_history:
+            times, prices = map(list, zip(*price_history))
+        else:
+            times, prices = [], []
+        
+        ChartDisplay.draw_chart_arr(times, prices, stock_symbol, config, currency)
+    
+    @staticmethod
+    def draw_chart_arr(times, prices, stock_symbol, config, currency='PLN', sample_count=None):
+        """
+        Draws stock price chart from parallel time and price sequences.
+        The rendered chart is reused while the history of the stock has
+        not changed, so reopening a chart between refreshes is instant.
+        
+        Args:
+            times: Sequence of time strings
+            prices: Sequence or NumPy array of prices
+            stock_symbol: Stock symbol
+            config: Config object, ConfigView or dictionary
             currency: Price currency
+            sample_count: Number of samples ever added to the history
+                (PriceHistory.sample_count); without it the chart is
+                reused only for identical times and prices
         """
-        if len(price_history) < 2:
+        if len(prices) < 2:
             console.print("[yellow]Not enough data to display chart.[/yellow]")
             return
         
-        times = [h[0] for h in price_history]
-        prices = [h[1] for h in price_history]
+        prices = np.asarray(prices, dtype=np.float64)
         
         # Get chart dimensions from config
-        plot_width = config['plot_width'] if isinstance(config, dict) else config.get('plot_width')
-        plot_height = config['plot_height'] if isinstance(config, dict) else config.get('plot_height')
+        if isinstance(config, dict):
+            plot_width = config['plot_width']
+            plot_height = config['plot_height']
+        else:
+            view = getattr(config, 'view', config)
+            plot_width = view.plot_width
+            plot_height = view.plot_height
+        
+        # The sample count grows with every sample, so a new sample always
+        # changes the key; time labels repeat daily and cannot do that alone
+        if sample_count is None:
+            history_key = (tuple(times), prices.tobytes())
+        else:
+            history_key = (sample_count, times[-1], float(prices[-1]))
+        key = (history_key, plot_width, plot_height, currency)
+        cached = ChartDisplay._chart_cache.get(stock_symbol)
+        if cached and cached[0] == key:
+            chart = cached[1]
+        else:
+            chart = Group(*ChartDisplay._build_chart(times, prices, stock_symbol, plot_width, plot_height, currency))
+            ChartDisplay._chart_cache[stock_symbol] = (key, chart)
+        
+        # The whole chart is rendered and written to the terminal in one print
+        console.print(chart)
+    
+    @staticmethod
+    def _build_chart(times, prices, stock_symbol, plot_width, plot_height, currency):
+        """
+        Builds the renderables of a stock price chart.
+        
+        Args:
+            times: Sequence of time strings
+            prices: float64 NumPy array of at least two prices
+            stock_symbol: Stock symbol
+            plot_width: Requested chart width
+            plot_height: Requested chart height
+            currency: Price currency
+        
+        Returns:
+            List of Rich renderables, printed in order
+        """
+        renderables = []
         
         # Adjust dimensions
         chart_width = min(plot_width, 80)
         chart_height = min(plot_height, 20)
         
         # Calculate min/max for scaling
-        min_price = min(prices)
-        max_price = max(prices)
-        price_range = max_price - min_price if max_price != min_price else 1
-        
-        # Build the chart using Unicode blocks
-        chart_lines = []
-        
-        # Characters for drawing (from bottom to top: empty, quarter, half, three-quarter, full)
-        blocks = [' ', '▁', '▂', '▃', '▄', '▅', '▆', '▇', '█']
-        
-        # Scale prices to fit height
-        scaled = []
-        for price in prices:
-            if price_range > 0:
-                normalized = (price - min_price) / price_range
-            else:
-                normalized = 0.5
-            scaled.append(normalized * (chart_height - 1))
-        
-        # Resample if needed to fit width
-        if len(scaled) > chart_width:
-            step = len(scaled) / chart_width
-            resampled = []
-            resampled_times = []
-            for i in range(chart_width):
-                idx = int(i * step)
-                resampled.append(scaled[idx])
-                resampled_times.append(times[idx])
-            scaled = resampled
-            times = resampled_times
-        
-        # Build chart from top to bottom
-        for row in range(chart_height - 1, -1, -1):
-            line = Text()
-            for col, val in enumerate(scaled):
-                if val >= row + 1:
-                    # Full block
-                    line.append("█", style="cyan")
-                elif val > row:
-                    # Partial block
-                    frac = val - row
-                    block_idx = int(frac * 8)
-                    block_idx = max(1, min(8, block_idx))
-                    line.append(blocks[block_idx], style="cyan")
-                else:
-                    line.append(" ")
-            chart_lines.append(line)
-        
-        # Create price labels
-        price_labels = Text()
-        price_labels.append(f"{max_price:.2f} {currency}\n", style="yellow")
-        for _ in range(chart_height - 2):
-            price_labels.append("\n")
-        price_labels.append(f"{min_price:.2f} {currency}", style="yellow")
+        min_price = float(prices.min())
+        max_price = float(prices.max())
+        
+        # Downsample to one sample per column, keeping the visual shape
+        plot_prices = prices
+        if len(prices) > chart_width:
+            indices = _lttb_indices(prices, chart_width)
+            plot_prices = prices[indices]
+            times = [times[i] for i in indices.tolist()]
+        
+        columns = len(plot_prices)
+        if max_price == min_price:
+            # Flat series: nothing to scale, draw a level line at mid-height
+            chart_lines = [" " * columns] * chart_height
+            chart_lines[chart_height // 2] = "█" * columns
+        else:
+            # Scale prices to fit height in one vectorized pass
+            scaled = (plot_prices - min_price) * ((chart_height - 1) / (max_price - min_price))
+            
+            # Height of every column in eighths of a row, rounded down except that
+            # a barely started row still shows the smallest block
+            eighths = scaled * 8
+            column_levels = eighths.astype(np.intp)
+            column_levels += (column_levels % 8 == 0) & (eighths > column_levels)
+            
+            # Eighths filled of every cell, rows from top to bottom
+            row_bases = np.arange(chart_height - 1, -1, -1)[:, None] * 8
+            levels = np.clip(column_levels - row_bases, 0, 8)
+            chart_lines = ["".join(row) for row in _CHART_BLOCKS[levels].tolist()]
         
         # Print chart header
-        symbol_clean = stock_symbol.replace('.WA', '')
-        console.print()
-        console.print(Panel(
+        symbol_clean = _short_symbol(stock_symbol)
+        renderables.append("")
+        renderables.append(Panel(
             f"📈 [bold cyan]Price Chart: {symbol_clean}[/bold cyan] ({currency})",
             border_style="cyan",
             padding=(0, 2)
         ))
-        console.print()
+        renderables.append("")
         
-        # Print the chart with border
-        console.print(f"  [dim]┌{'─' * len(scaled)}┐[/dim]")
+        # Collect the bordered chart and emit it in a single print call
+        border = '─' * columns
+        frame = [Text.from_markup(f"  [dim]┌{border}┐[/dim]")]
         for i, line in enumerate(chart_lines):
             # Add price label on the right side
             if i == 0:
@@ -226,8 +467,11 @@ class ChartDisplay:
             else:
                 price_label = ""
             
-            console.print(Text.from_markup("  [dim]│[/dim]") + line + Text.from_markup(f"[dim]│[/dim][yellow]{price_label}[/yellow]"))
-        console.print(f"  [dim]└{'─' * len(scaled)}┘[/dim]")
+            frame.append(Text.assemble(
+                ("  │", "dim"), (line, "cyan"), ("│", "dim"), (price_label, "yellow")
+            ))
+        frame.append(Text.from_markup(f"  [dim]└{border}┘[/dim]"))
+        renderables.append(Text("\n").join(frame))
         
         # Print time labels
         if len(times) > 0:
@@ -239,19 +483,19 @@ class ChartDisplay:
             mid_time = times[mid_idx] if mid_idx < len(times) else ""
             
             # Calculate spacing
-            spacing = len(scaled) // 2 - len(first_time)
+            spacing = columns // 2 - len(first_time)
             time_line = f"   [dim]{first_time}[/dim]"
             time_line += " " * max(0, spacing - len(mid_time) // 2)
             time_line += f"[dim]{mid_time}[/dim]"
             time_line += " " * max(0, spacing - len(mid_time) // 2)
             time_line += f"[dim]{last_time}[/dim]"
-            console.print(time_line)
+            renderables.append(time_line)
         
-        console.print()
+        renderables.append("")
         
         # Show statistics
-        current_price = prices[-1]
-        first_price = prices[0]
+        current_price = float(prices[-1])
+        first_price = float(prices[0])
         change = current_price - first_price
         change_pct = (change / first_price * 100) if first_price != 0 else 0
         
@@ -272,7 +516,36 @@ class ChartDisplay:
         stats.add_row("Change:", f"[{change_style}]{change_symbol} {change:+.2f} ({change_pct:+.2f}%)[/{change_style}]")
         stats.add_row("Data points:", f"{len(prices)}")
         
-        console.print(Panel(stats, title="[bold]Statistics[/bold]", border_style="blue"))
+        renderables.append(Panel(stats, title="[bold]Statistics[/bold]", border_style="blue"))
+        
+        return renderables
+
+
+# ANSI escape sequences:
+# \033[2J - clear entire screen
+# \033[H - move cursor to home position (1,1)
+_CLEAR_HOME = b'\033[2J\033[H'
+
+# Static messages, parsed once at import instead of on every call
+_HEADER_RULE = "═" * 50
+_HEADER = Group(
+    Text("\n" + _HEADER_RULE, style="bold cyan"),
+    Align.center(Text("📈 GPW Stock Price Monitor 📈", style="bold magenta")),
+    Text(_HEADER_RULE + "\n", style="bold cyan"),
+)
+_GOODBYE = Text("\n\n👋 Stopped monitoring prices.\n", style="yellow")
+_HELP_PANEL = Panel.fit(
+    "[bold cyan]GPW Stock Price Monitor[/bold cyan]\n\n"
+    "[yellow]Usage:[/yellow] [bold]python gpw_kurs.py STOCKS_FILE[/bold]\n"
+    "[yellow]Example:[/yellow] [bold]python gpw_kurs.py akcje.txt[/bold]\n\n"
+    "[dim]File format: one stock symbol per line[/dim]\n"
+    "[dim]Example file contents:[/dim]\n"
+    "  [green]PKO[/green]\n"
+    "  [green]PKNORLEN[/green]\n"
+    "  [green]KGHM[/green]",
+    border_style="blue",
+    title="📊 Help"
+)
 
 
 class UIDisplay:
@@ -281,25 +554,12 @@ class UIDisplay:
     @staticmethod
     def show_header():
         """Display application header."""
-        console.print("\n[bold cyan]═" * 50 + "[/bold cyan]")
-        console.print(Align.center("[bold magenta]📈 GPW Stock Price Monitor 📈[/bold magenta]"))
-        console.print("[bold cyan]═" * 50 + "[/bold cyan]\n")
+        console.print(_HEADER)
     
     @staticmethod
     def show_help():
         """Display help message."""
-        console.print(Panel.fit(
-            "[bold cyan]GPW Stock Price Monitor[/bold cyan]\n\n"
-            "[yellow]Usage:[/yellow] [bold]python gpw_kurs.py STOCKS_FILE[/bold]\n"
-            "[yellow]Example:[/yellow] [bold]python gpw_kurs.py akcje.txt[/bold]\n\n"
-            "[dim]File format: one stock symbol per line[/dim]\n"
-            "[dim]Example file contents:[/dim]\n"
-            "  [green]PKO[/green]\n"
-            "  [green]PKNORLEN[/green]\n"
-            "  [green]KGHM[/green]",
-            border_style="blue",
-            title="📊 Help"
-        ))
+        console.print(_HELP_PANEL)
     
     @staticmethod
     def show_loading_info(stocks_file, stocks, refresh_interval):
@@ -311,10 +571,12 @@ class UIDisplay:
             stocks: Dictionary of stocks
             refresh_interval: Refresh interval in seconds
         """
-        console.print(f"[cyan]📂 Loading stock list from file:[/cyan] [bold]{stocks_file}[/bold]")
-        console.print(f"[green]✅ Found {len(stocks)} stocks:[/green] [bold]{', '.join(stocks.keys())}[/bold]")
-        console.print(f"\n[cyan]⏱️  Refresh interval:[/cyan] [bold yellow]{refresh_interval} seconds[/bold yellow]")
-        console.print("[dim]Press Ctrl+C to stop.[/dim]\n")
+        console.print(
+            f"[cyan]📂 Loading stock list from file:[/cyan] [bold]{stocks_file}[/bold]\n"
+            f"[green]✅ Found {len(stocks)} stocks:[/green] [bold]{', '.join(stocks.keys())}[/bold]\n"
+            f"\n[cyan]⏱️  Refresh interval:[/cyan] [bold yellow]{refresh_interval} seconds[/bold yellow]\n"
+            "[dim]Press Ctrl+C to stop.[/dim]\n"
+        )
     
     @staticmethod
     def show_error(message):
@@ -329,7 +591,7 @@ class UIDisplay:
     @staticmethod
     def show_goodbye():
         """Display goodbye message."""
-        console.print("\n\n[yellow]👋 Stopped monitoring prices.[/yellow]\n")
+        console.print(_GOODBYE)
     
     @staticmethod
     def clear():
@@ -339,12 +601,16 @@ class UIDisplay:
     @staticmethod
     def clear_and_home():
         """Clear screen and move cursor to home position without scrolling."""
-        # ANSI escape sequences:
-        # \033[2J - clear entire screen
-        # \033[H - move cursor to home position (1,1)
-        import sys
-        sys.stdout.write('\033[2J\033[H')
-        sys.stdout.flush()
+        try:
+            fd = sys.stdout.fileno()
+        except (AttributeError, ValueError):
+            # Streams without a descriptor (e.g. captured output) take text
+            sys.stdout.write(_CLEAR_HOME.decode('ascii'))
+            sys.stdout.flush()
+            return
+        
+        # Unbuffered write of the pre-encoded escape sequences
+        os.write(fd, _CLEAR_HOME)
     
     @staticmethod
     def create_refresh_progress_bar(remaining_seconds, total_seconds):
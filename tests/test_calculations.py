@@ -3,7 +3,7 @@ Unit tests for calculations module.
 """
 
 import unittest
-from src.calculations import calculate_profit_loss, ProfitLossCalculator
+from src.calculations import calculate_profit_loss, calculate_profit_loss_batch, ProfitLossCalculator
 
 
 class TestCalculateProfitLoss(unittest.TestCase):
@@ -90,6 +90,33 @@ class TestCalculateProfitLoss(unittest.TestCase):
         self.assertTrue(is_profit)
 
 
+class TestCalculateProfitLossBatch(unittest.TestCase):
+    """Tests for calculate_profit_loss_batch function."""
+    
+    def test_matches_scalar_calculation(self):
+        """Test that batch results equal per-stock results."""
+        current_prices = [120.00, 80.00, 100.00, 45.67]
+        purchase_prices = [100.00, 100.00, 100.00, 40.00]
+        
+        result = calculate_profit_loss_batch(current_prices, purchase_prices)
+        
+        expected = [calculate_profit_loss(c, p) for c, p in zip(current_prices, purchase_prices)]
+        self.assertEqual(result, expected)
+    
+    def test_zero_purchase_and_unknown_price(self):
+        """Test that zero purchase prices and unknown prices yield no result."""
+        result = calculate_profit_loss_batch([50.00, float('nan'), 60.00], [0.00, 40.00, 50.00])
+        
+        self.assertEqual(result[0], (None, None, None))
+        self.assertEqual(result[1], (None, None, None))
+        self.assertAlmostEqual(result[2][0], 20.0)
+        self.assertTrue(result[2][2])
+    
+    def test_empty(self):
+        """Test batch calculation without stocks."""
+        self.assertEqual(calculate_profit_loss_batch([], []), [])
+
+
 class TestProfitLossCalculator(unittest.TestCase):
     """Tests for ProfitLossCalculator class."""
     
@@ -104,6 +131,15 @@ class TestProfitLossCalculator(unittest.TestCase):
         self.assertAlmostEqual(amount, 50.0, places=2)
         self.assertTrue(is_profit)
     
+    def test_calculate_batch_method(self):
+        """Test calculate_batch static method."""
+        result = ProfitLossCalculator.calculate_batch([150.00, 0.50], [100.00, 0.00])
+        
+        self.assertAlmostEqual(result[0][0], 50.0, places=2)
+        self.assertAlmostEqual(result[0][1], 50.0, places=2)
+        self.assertTrue(result[0][2])
+        self.assertEqual(result[1], (None, None, None))
+    
     def test_format_percentage_profit(self):
         """Test formatting percentage for profit."""
         result = ProfitLossCalculator.format_percentage(25.5, True)
@@ -143,6 +179,21 @@ class TestProfitLossCalculator(unittest.TestCase):
         """Test formatting zero amount."""
         result = ProfitLossCalculator.format_amount(0.0, "EUR", True)
         self.assertEqual(result, "+0.00 EUR")
+    
+    def test_format_row_profit(self):
+        """Test formatting a profitable row."""
+        result = ProfitLossCalculator.format_row(25.5, 12.0, "PLN", True)
+        self.assertEqual(result, ("+25.50%", "+12.00 PLN", "green"))
+    
+    def test_format_row_loss(self):
+        """Test formatting a losing row."""
+        result = ProfitLossCalculator.format_row(-15.25, -3.5, "USD", False)
+        self.assertEqual(result, ("-15.25%", "-3.50 USD", "red"))
+    
+    def test_format_row_none(self):
+        """Test formatting a row without profit/loss."""
+        result = ProfitLossCalculator.format_row(None, None, "PLN", None)
+        self.assertEqual(result, ("-", "-", "dim"))
 
 
 if __name__ == '__main__':
@@ -6,7 +6,7 @@ import unittest
 import os
 import tempfile
 from unittest.mock import patch, mock_open
-from src.config import Config, load_stocks_from_file
+from src.config import Config, ConfigView, FastConfigParser, load_stocks_from_file
 
 
 class TestConfig(unittest.TestCase):
@@ -53,20 +53,96 @@ class TestConfig(unittest.TestCase):
         self.assertFalse('nonexistent_key' in config)
     
     @patch('os.path.exists')
-    @patch('configparser.ConfigParser.read')
-    @patch('configparser.ConfigParser.getint')
-    def test_load_config_from_file(self, mock_getint, mock_read, mock_exists):
-        """Test loading configuration from file."""
-        mock_exists.return_value = True
-        mock_getint.side_effect = [60, 100, 120, 25]  # refresh, max_history, plot_width, plot_height
+    def test_view_attribute_access(self, mock_exists):
+        """Test that the settings view mirrors the settings dictionary."""
+        mock_exists.return_value = False
         
         config = Config('config.ini')
         
-        mock_read.assert_called_once()
-        self.assertEqual(config.settings['refresh_interval'], 60)
-        self.assertEqual(config.settings['max_history'], 100)
-        self.assertEqual(config.settings['plot_width'], 120)
-        self.assertEqual(config.settings['plot_height'], 25)
+        self.assertIsInstance(config.view, ConfigView)
+        self.assertEqual(config.view.refresh_interval, config['refresh_interval'])
+        self.assertEqual(config.view._asdict(), config.settings)
+    
+    def test_load_config_from_file(self):
+        """Test loading configuration from file."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.ini', delete=False) as f:
+            f.write("[Settings]\n")
+            f.write("# Refresh interval in seconds\n")
+            f.write("refresh_interval = 60\n")
+            f.write("max_history = 100\n")
+            f.write("plot_width = 120\n")
+            f.write("plot_height = 25\n")
+            temp_file = f.name
+        
+        try:
+            config = Config(temp_file)
+            
+            self.assertEqual(config.settings['refresh_interval'], 60)
+            self.assertEqual(config.settings['max_history'], 100)
+            self.assertEqual(config.settings['plot_width'], 120)
+            self.assertEqual(config.settings['plot_height'], 25)
+        finally:
+            os.unlink(temp_file)
+    
+    def test_load_config_missing_keys_use_defaults(self):
+        """Test that keys missing from file fall back to defaults."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.ini', delete=False) as f:
+            f.write("[Settings]\nrefresh_interval = 15\n")
+            temp_file = f.name
+        
+        try:
+            config = Config(temp_file)
+            
+            self.assertEqual(config.settings['refresh_interval'], 15)
+            self.assertEqual(config.settings['max_history'], Config.DEFAULT_SETTINGS['max_history'])
+        finally:
+            os.unlink(temp_file)
+    
+    def test_load_config_invalid_value(self):
+        """Test that invalid values fall back to default settings."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.ini', delete=False) as f:
+            f.write("[Settings]\nrefresh_interval = fast\n")
+            temp_file = f.name
+        
+        try:
+            config = Config(temp_file)
+            
+            self.assertEqual(config.settings, Config.DEFAULT_SETTINGS)
+        finally:
+            os.unlink(temp_file)
+    
+    def test_load_config_parsed_once(self):
+        """Test that an unchanged config file is parsed only once."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.ini', delete=False) as f:
+            f.write("[Settings]\nrefresh_interval = 45\n")
+            temp_file = f.name
+        
+        try:
+            with patch('src.config.FastConfigParser.read', wraps=FastConfigParser.read) as mock_read:
+                first = Config(temp_file)
+                second = Config(temp_file)
+            
+            mock_read.assert_called_once()
+            self.assertEqual(first.settings, second.settings)
+            self.assertIsNot(first.settings, second.settings)
+        finally:
+            os.unlink(temp_file)
+
+
+class TestFastConfigParser(unittest.TestCase):
+    """Tests for FastConfigParser class."""
+    
+    def test_read_sections_and_comments(self):
+        """Test parsing sections while skipping comments and blank lines."""
+        content = "; header\n[Settings]\n# comment\n\nRefresh_Interval = 10\n[Other]\nkey=value \n"
+        
+        with patch('builtins.open', mock_open(read_data=content)):
+            result = FastConfigParser.read('config.ini')
+        
+        self.assertEqual(result, {
+            'Settings': {'refresh_interval': '10'},
+            'Other': {'key': 'value'}
+        })
 
 
 class TestLoadStocksFromFile(unittest.TestCase):
@@ -111,6 +187,15 @@ class TestLoadStocksFromFile(unittest.TestCase):
         self.assertEqual(result['PKNORLEN'], 0.00)
         self.assertEqual(result['KGHM'], 120.50)
     
+    def test_load_stocks_whitespace_and_case(self):
+        """Test that symbols are normalized and prices parsed around spaces."""
+        content = "  pko , 45.67 \nkghm,\nPKNORLEN , abc\n"
+        
+        with patch('builtins.open', mock_open(read_data=content)):
+            result = load_stocks_from_file('test.txt')
+        
+        self.assertEqual(result, {'PKO': 45.67, 'KGHM': 0.00, 'PKNORLEN': 0.00})
+    
     def test_load_stocks_skip_empty_lines(self):
         """Test that empty lines are skipped."""
         content = "PKO,45.67\n\nPKNORLEN,58.90\n\n\nKGHM,120.50\n"
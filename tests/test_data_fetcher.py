@@ -2,9 +2,18 @@
 Unit tests for data_fetcher module.
 """
 
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
 import unittest
 from unittest.mock import Mock, patch, MagicMock
-from src.data_fetcher import StockData, StockDataFetcher, PriceHistory
+import numpy as np
+import pandas as pd
+from src.data_fetcher import StockData, StockDataFetcher, PriceHistory, _lazy_import
 
 
 class TestStockData(unittest.TestCase):
@@ -31,9 +40,44 @@ class TestStockData(unittest.TestCase):
         self.assertEqual(result['currency'], "PLN")
 
 
+class TestLazyImport(unittest.TestCase):
+    """Tests for deferred yfinance import."""
+    
+    def test_lazy_import_returns_loaded_module(self):
+        """Test that an already imported module is returned as is."""
+        self.assertIs(_lazy_import('json'), json)
+    
+    def test_lazy_import_missing_module(self):
+        """Test that a module that is not installed raises ImportError."""
+        with self.assertRaises(ImportError):
+            _lazy_import('gpw_no_such_module')
+    
+    def test_module_import_defers_yfinance(self):
+        """Test that importing data_fetcher does not load yfinance and pandas."""
+        code = "import sys, src.data_fetcher; print('pandas' in sys.modules)"
+        repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        
+        result = subprocess.run([sys.executable, '-c', code], cwd=repo_root, capture_output=True, text=True)
+        
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout.strip(), 'False')
+
+
 class TestStockDataFetcher(unittest.TestCase):
     """Tests for StockDataFetcher class."""
     
+    @patch('src.data_fetcher.yf')
+    def test_configure_network_retries(self, mock_yf):
+        """Test that yfinance retries are enabled on construction."""
+        StockDataFetcher()
+        
+        self.assertEqual(mock_yf.config.network.retries, StockDataFetcher.NETWORK_RETRIES)
+    
+    @patch('src.data_fetcher.yf', spec=[])
+    def test_configure_network_without_config(self, mock_yf):
+        """Test that older yfinance versions without config are tolerated."""
+        StockDataFetcher.configure_network(3)
+    
     def test_normalize_symbol_without_suffix(self):
         """Test normalizing symbol without .WA suffix."""
         result = StockDataFetcher.normalize_symbol("PKO")
@@ -54,6 +98,7 @@ class TestStockDataFetcher(unittest.TestCase):
         """Test successful stock price fetch."""
         # Mock yfinance response
         mock_stock = Mock()
+        mock_stock.fast_info = {}
         mock_stock.info = {
             'currentPrice': 45.67,
             'currency': 'PLN',
@@ -61,7 +106,7 @@ class TestStockDataFetcher(unittest.TestCase):
         }
         mock_ticker.return_value = mock_stock
         
-        result = StockDataFetcher.get_stock_price("PKO")
+        result = StockDataFetcher().get_stock_price("PKO")
         
         self.assertIsInstance(result, StockData)
         self.assertEqual(result.symbol, "PKO.WA")
@@ -69,18 +114,84 @@ class TestStockDataFetcher(unittest.TestCase):
         self.assertEqual(result.currency, "PLN")
         self.assertEqual(result.name, "PKO Bank Polski SA")
     
+    @patch('src.data_fetcher.yf.Ticker')
+    def test_get_stock_price_fast_info(self, mock_ticker):
+        """Test that fast_info is used for price and currency."""
+        mock_stock = Mock()
+        mock_stock.fast_info = {'lastPrice': 46.10, 'currency': 'PLN'}
+        mock_stock.info = {'currentPrice': 45.67, 'longName': 'PKO Bank Polski SA'}
+        mock_ticker.return_value = mock_stock
+        
+        result = StockDataFetcher().get_stock_price("PKO")
+        
+        self.assertEqual(result.price, 46.10)
+        self.assertEqual(result.currency, "PLN")
+        self.assertEqual(result.name, "PKO Bank Polski SA")
+    
+    def test_extract_fast_info_previous_close(self):
+        """Test that fast_info falls back to the previous close."""
+        fast_info = {'lastPrice': None, 'previousClose': 44.90, 'currency': 'PLN'}
+        
+        self.assertEqual(StockDataFetcher._extract_fast_info(fast_info), (44.90, 'PLN'))
+    
+    def test_extract_fast_info_error(self):
+        """Test that fast_info errors yield no price."""
+        fast_info = Mock()
+        fast_info.get.side_effect = Exception("Network error")
+        
+        self.assertEqual(StockDataFetcher._extract_fast_info(fast_info), (None, None))
+    
+    @patch('src.data_fetcher.yf.Ticker')
+    def test_get_cached_currency(self, mock_ticker):
+        """Test that the currency of a fetched stock is served from memory."""
+        mock_stock = Mock()
+        mock_stock.fast_info = {'lastPrice': 10.0, 'currency': 'EUR'}
+        mock_stock.info = {'longName': 'Foreign SA'}
+        mock_ticker.return_value = mock_stock
+        fetcher = StockDataFetcher()
+        
+        self.assertEqual(fetcher.get_cached_currency("ABC"), 'PLN')
+        fetcher.get_stock_price("ABC")
+        
+        self.assertEqual(fetcher.get_cached_currency("ABC"), 'EUR')
+        self.assertEqual(fetcher.get_cached_currency("ABC.WA"), 'EUR')
+        self.assertEqual(mock_ticker.call_count, 1)
+    
+    @patch('src.data_fetcher.yf.Ticker')
+    def test_get_stock_price_name_cached(self, mock_ticker):
+        """Test that full info is only requested once per symbol."""
+        info_calls = []
+        
+        class FakeStock:
+            fast_info = {'lastPrice': 46.10, 'currency': 'PLN'}
+            
+            @property
+            def info(self):
+                info_calls.append(1)
+                return {'longName': 'PKO Bank Polski SA'}
+        
+        mock_ticker.return_value = FakeStock()
+        
+        fetcher = StockDataFetcher()
+        fetcher.get_stock_price("PKO")
+        result = fetcher.get_stock_price("PKO")
+        
+        self.assertEqual(result.name, "PKO Bank Polski SA")
+        self.assertEqual(len(info_calls), 1)
+    
     @patch('src.data_fetcher.yf.Ticker')
     def test_get_stock_price_no_price(self, mock_ticker):
         """Test stock price fetch when no price available."""
         # Mock yfinance response without price
         mock_stock = Mock()
+        mock_stock.fast_info = {}
         mock_stock.info = {
             'currency': 'PLN',
             'longName': 'PKO Bank Polski SA'
         }
         mock_ticker.return_value = mock_stock
         
-        result = StockDataFetcher.get_stock_price("PKO")
+        result = StockDataFetcher().get_stock_price("PKO")
         
         self.assertIsNone(result)
     
@@ -89,10 +200,254 @@ class TestStockDataFetcher(unittest.TestCase):
         """Test stock price fetch with exception."""
         mock_ticker.side_effect = Exception("Network error")
         
-        result = StockDataFetcher.get_stock_price("PKO")
+        result = StockDataFetcher().get_stock_price("PKO")
         
         self.assertIsNone(result)
     
+    @patch('src.data_fetcher.yf.Ticker')
+    def test_get_stock_price_cached_within_ttl(self, mock_ticker):
+        """Test that repeated calls within ttl reuse the cached result."""
+        mock_stock = Mock()
+        mock_stock.fast_info = {}
+        mock_stock.info = {'currentPrice': 45.67, 'currency': 'PLN', 'longName': 'PKO Bank Polski SA'}
+        mock_ticker.return_value = mock_stock
+        
+        fetcher = StockDataFetcher(ttl=60)
+        first = fetcher.get_stock_price("PKO")
+        second = fetcher.get_stock_price("PKO")
+        
+        self.assertIs(first, second)
+        mock_ticker.assert_called_once()
+    
+    @patch('src.data_fetcher.yf.Ticker')
+    def test_get_stock_price_no_cache_by_default(self, mock_ticker):
+        """Test that a zero ttl always fetches fresh data."""
+        mock_stock = Mock()
+        mock_stock.fast_info = {}
+        mock_stock.info = {'currentPrice': 45.67, 'currency': 'PLN', 'longName': 'PKO Bank Polski SA'}
+        mock_ticker.return_value = mock_stock
+        
+        fetcher = StockDataFetcher()
+        fetcher.get_stock_price("PKO")
+        fetcher.get_stock_price("PKO")
+        
+        self.assertEqual(mock_ticker.call_count, 2)
+    
+    @patch('src.data_fetcher.StockDataFetcher.fetch_stock_price')
+    def test_get_stock_prices(self, mock_fetch):
+        """Test fetching prices for multiple stocks at once."""
+        mock_fetch.side_effect = lambda symbol: (
+            StockData(f"{symbol}.WA", symbol, 10.0, "PLN") if symbol != "BAD" else None
+        )
+        
+        result = StockDataFetcher().get_stock_prices(["PKO", "BAD", "KGHM"])
+        
+        self.assertEqual(list(result.keys()), ["PKO", "BAD", "KGHM"])
+        self.assertEqual(result["PKO"].symbol, "PKO.WA")
+        self.assertIsNone(result["BAD"])
+        self.assertEqual(mock_fetch.call_count, 3)
+    
+    @patch('src.data_fetcher.StockDataFetcher.fetch_stock_price')
+    def test_get_stock_prices_reuses_thread_pool(self, mock_fetch):
+        """Test that the thread pool is created once and released by close()."""
+        mock_fetch.return_value = StockData("PKO.WA", "PKO", 10.0, "PLN")
+        fetcher = StockDataFetcher()
+        
+        fetcher.get_stock_prices(["PKO"])
+        executor = fetcher._executor
+        fetcher.get_stock_prices(["PKO"])
+        
+        self.assertIsNotNone(executor)
+        self.assertIs(fetcher._executor, executor)
+        fetcher.close()
+        self.assertIsNone(fetcher._executor)
+    
+    @patch('src.data_fetcher.StockDataFetcher.fetch_stock_price')
+    def test_get_stock_prices_timeout_uses_stale(self, mock_fetch):
+        """Test that a stock not fetched in time gets its last good quote."""
+        mock_fetch.side_effect = lambda symbol: time.sleep(0.2)
+        fetcher = StockDataFetcher()
+        fetcher.FETCH_TIMEOUT = 0.01
+        fetcher._stale["PKO"] = (time.monotonic(), StockData("PKO.WA", "PKO", 40.0, "PLN"))
+        
+        result = fetcher.get_stock_prices(["PKO"])
+        fetcher.close()
+        
+        self.assertEqual(result["PKO"].price, 40.0)
+        self.assertTrue(result["PKO"].stale)
+    
+    @patch('src.data_fetcher.StockDataFetcher.fetch_stock_price')
+    def test_get_stock_prices_does_not_requeue_running_fetch(self, mock_fetch):
+        """Test that a fetch still running after a timeout is not submitted again."""
+        release = threading.Event()
+        mock_fetch.side_effect = lambda symbol: release.wait(1)
+        fetcher = StockDataFetcher()
+        fetcher.FETCH_TIMEOUT = 0.01
+        
+        fetcher.get_stock_prices(["PKO"])
+        fetcher.get_stock_prices(["PKO"])
+        release.set()
+        fetcher.close()
+        
+        mock_fetch.assert_called_once_with("PKO")
+    
+    @patch('src.data_fetcher.StockDataFetcher.fetch_stock_price')
+    def test_failed_fetch_falls_back_to_session_quote(self, mock_fetch):
+        """Test that a failed fetch returns the last quote fetched in this session."""
+        mock_fetch.return_value = StockData("PKO.WA", "PKO", 50.0, "PLN")
+        fetcher = StockDataFetcher()
+        fetcher._stale["PKO"] = (time.monotonic() - 30 * 24 * 60 * 60, StockData("PKO.WA", "PKO", 10.0, "PLN"))
+        
+        fresh = fetcher.get_stock_price("PKO")
+        mock_fetch.return_value = None
+        fallback = fetcher.get_stock_price("PKO")
+        
+        self.assertFalse(fresh.stale)
+        self.assertEqual(fallback.price, 50.0)
+        self.assertTrue(fallback.stale)
+    
+    def test_get_stock_prices_empty(self):
+        """Test fetching prices for an empty symbol list."""
+        self.assertEqual(StockDataFetcher().get_stock_prices([]), {})
+    
+    @patch('src.data_fetcher.yf.download')
+    @patch('src.data_fetcher.yf.Ticker')
+    def test_get_stock_prices_batched_after_first_fetch(self, mock_ticker, mock_download):
+        """Test that stocks with known name and currency are priced in one batch."""
+        mock_stock = Mock()
+        mock_stock.fast_info = {'lastPrice': 45.0, 'currency': 'PLN'}
+        mock_stock.info = {'longName': 'Company SA'}
+        mock_ticker.return_value = mock_stock
+        columns = pd.MultiIndex.from_product([['PKO.WA', 'KGHM.WA'], ['Close', 'Volume']])
+        mock_download.return_value = pd.DataFrame(
+            [[46.0, 100, 150.0, 10], [46.5, 200, float('nan'), 0]], columns=columns
+        )
+        
+        fetcher = StockDataFetcher()
+        fetcher.get_stock_prices(["PKO", "KGHM"])
+        mock_download.assert_not_called()
+        
+        result = fetcher.get_stock_prices(["PKO", "KGHM"])
+        
+        mock_download.assert_called_once()
+        self.assertEqual(mock_download.call_args[0][0], ["PKO.WA", "KGHM.WA"])
+        self.assertEqual(mock_ticker.call_count, 2)
+        self.assertEqual(result["PKO"].price, 46.5)
+        self.assertEqual(result["KGHM"].price, 150.0)
+        self.assertEqual(result["KGHM"].name, "Company SA")
+        self.assertEqual(result["KGHM"].currency, "PLN")
+    
+    @patch('src.data_fetcher.yf.download')
+    @patch('src.data_fetcher.StockDataFetcher.fetch_stock_price')
+    def test_get_stock_prices_batch_failure_falls_back(self, mock_fetch, mock_download):
+        """Test that stocks the batch cannot price are fetched one by one."""
+        mock_download.side_effect = Exception("Network error")
+        mock_fetch.return_value = StockData("PKO.WA", "PKO", 10.0, "PLN")
+        fetcher = StockDataFetcher()
+        fetcher._currencies["PKO.WA"] = "PLN"
+        fetcher._names["PKO.WA"] = "PKO"
+        
+        result = fetcher.get_stock_prices(["PKO"])
+        
+        mock_download.assert_called_once()
+        mock_fetch.assert_called_once_with("PKO")
+        self.assertEqual(result["PKO"].price, 10.0)
+    
+    @patch('src.data_fetcher.yf.download')
+    def test_download_prices_in_concurrent_batches(self, mock_download):
+        """Test that symbols are split into BATCH_SIZE chunks downloaded on the pool."""
+        def download(symbols, **kwargs):
+            columns = pd.MultiIndex.from_product([symbols, ['Close']])
+            return pd.DataFrame([[10.0] * len(symbols)], columns=columns)
+        
+        mock_download.side_effect = download
+        stock_symbols = [f"S{i}" for i in range(45)]
+        fetcher = StockDataFetcher()
+        
+        prices = fetcher.download_prices(stock_symbols)
+        fetcher.close()
+        
+        self.assertEqual(mock_download.call_count, 3)
+        self.assertEqual(sorted(len(call.args[0]) for call in mock_download.call_args_list), [5, 20, 20])
+        self.assertEqual(prices, {stock_symbol: 10.0 for stock_symbol in stock_symbols})
+    
+    @patch('src.data_fetcher.StockDataFetcher.fetch_stock_price')
+    def test_cache_file_round_trip(self, mock_fetch):
+        """Test that quotes saved by one fetcher warm up the next one."""
+        mock_fetch.return_value = StockData("PKO.WA", "PKO Bank Polski SA", 45.67, "PLN")
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache_file = os.path.join(temp_dir, 'cache.json')
+            first = StockDataFetcher(ttl=60, cache_file=cache_file)
+            first.get_stock_price("PKO")
+            first.save_cache_file()
+            
+            second = StockDataFetcher(ttl=60, cache_file=cache_file)
+            result = second.get_stock_price("PKO")
+        
+        self.assertEqual(mock_fetch.call_count, 1)
+        self.assertEqual(result.price, 45.67)
+        self.assertEqual(result.name, "PKO Bank Polski SA")
+    
+    @patch('src.data_fetcher.StockDataFetcher.fetch_stock_price')
+    def test_cache_file_stale_fallback(self, mock_fetch):
+        """Test that expired persisted quotes are used only when fetching fails."""
+        mock_fetch.return_value = None
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache_file = os.path.join(temp_dir, 'cache.json')
+            with open(cache_file, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'PKO': {'symbol': 'PKO.WA', 'name': 'PKO', 'price': 40.0,
+                            'currency': 'PLN', 'time': time.time() - 600},
+                    'KGHM': {'symbol': 'KGHM.WA', 'name': 'KGHM', 'price': 150.0,
+                             'currency': 'PLN', 'time': 0}
+                }, f)
+            
+            fetcher = StockDataFetcher(ttl=60, cache_file=cache_file)
+            result = fetcher.get_stock_price("PKO")
+            expired = fetcher.get_stock_price("KGHM")
+        
+        self.assertEqual(mock_fetch.call_count, 2)
+        self.assertEqual(result.price, 40.0)
+        self.assertTrue(result.stale)
+        self.assertIsNone(expired)
+    
+    @patch('src.data_fetcher.yf.Ticker')
+    def test_cache_file_restores_metadata(self, mock_ticker):
+        """Test that persisted names and currencies spare the info request."""
+        mock_stock = Mock(spec=['fast_info'])
+        mock_stock.fast_info = {'lastPrice': 46.0, 'currency': 'PLN'}
+        mock_ticker.return_value = mock_stock
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache_file = os.path.join(temp_dir, 'cache.json')
+            with open(cache_file, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'PKO': {'symbol': 'PKO.WA', 'name': 'PKO Bank Polski SA', 'price': 40.0,
+                            'currency': 'PLN', 'time': time.time() - 3600},
+                    'KGHM': {'symbol': 'KGHM.WA', 'name': 'KGHM', 'price': 150.0,
+                             'currency': 'PLN', 'time': 0},
+                }, f)
+            
+            fetcher = StockDataFetcher(ttl=60, cache_file=cache_file)
+            result = fetcher.get_stock_price("PKO")
+        
+        self.assertEqual(result.price, 46.0)
+        self.assertEqual(result.name, "PKO Bank Polski SA")
+        self.assertNotIn("KGHM.WA", fetcher._names)
+    
+    def test_cache_file_missing_or_corrupt(self):
+        """Test that an unreadable cache file is ignored."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache_file = os.path.join(temp_dir, 'cache.json')
+            with open(cache_file, 'w', encoding='utf-8') as f:
+                f.write("not json")
+            
+            fetcher = StockDataFetcher(ttl=60, cache_file=cache_file)
+        
+        self.assertEqual(fetcher._cache, {})
+    
     def test_extract_price_with_current_price(self):
         """Test extracting price from info with currentPrice."""
         info = {'currentPrice': 45.67}
@@ -125,7 +480,17 @@ class TestPriceHistory(unittest.TestCase):
         """Test PriceHistory initialization."""
         history = PriceHistory(max_history=10)
         self.assertEqual(history.max_history, 10)
-        self.assertEqual(history._history, {})
+        self.assertEqual(history.get("PKO"), [])
+        self.assertNotIn("PKO", history)
+    
+    def test_init_zero_max_history(self):
+        """Test that max_history of 0 is clamped so adding prices still works."""
+        history = PriceHistory(max_history=0)
+        history.add("PKO", "10:00", 45.0)
+        history.add_bulk("PKO", ["10:01", "10:02"], [46.0, 47.0])
+        
+        self.assertEqual(history.max_history, 1)
+        self.assertEqual(history.get("PKO"), [("10:02", 47.0)])
     
     def test_init_default_max_history(self):
         """Test PriceHistory with default max_history."""
@@ -167,6 +532,67 @@ class TestPriceHistory(unittest.TestCase):
         self.assertEqual(result[0][0], "10:30:00")
         self.assertEqual(result[-1][0], "11:30:00")
     
+    def test_add_wraps_ring_buffer(self):
+        """Test that history stays ordered after wrapping around several times."""
+        history = PriceHistory(max_history=3)
+        for i in range(8):
+            history.add("PKO", f"10:0{i}:00", 40.0 + i)
+        
+        self.assertEqual(history.get_times("PKO"), ["10:05:00", "10:06:00", "10:07:00"])
+        self.assertEqual(history.get_prices("PKO").tolist(), [45.0, 46.0, 47.0])
+        self.assertEqual(history.get("PKO")[-1], ("10:07:00", 47.0))
+    
+    def test_add_bulk(self):
+        """Test seeding history with many points in one call."""
+        history = PriceHistory(max_history=10)
+        history.add_bulk("PKO", ["10:00:00", "10:30:00", "11:00:00"], np.array([45.67, 46.00, 45.80]))
+        
+        self.assertEqual(history.get("PKO"), [("10:00:00", 45.67), ("10:30:00", 46.00), ("11:00:00", 45.80)])
+    
+    def test_sample_count(self):
+        """Test that the sample count keeps growing once the history is full."""
+        history = PriceHistory(max_history=2)
+        for i in range(3):
+            history.add("PKO", f"10:0{i}:00", 45.0)
+        history.add_bulk("PKO", ["10:03:00", "10:04:00"], [45.0, 45.0])
+        
+        self.assertEqual(history.sample_count("PKO"), 5)
+        self.assertEqual(history.sample_count("NONEXISTENT"), 0)
+    
+    def test_add_bulk_length_mismatch(self):
+        """Test that times and prices of different lengths are rejected."""
+        history = PriceHistory()
+        
+        with self.assertRaises(ValueError):
+            history.add_bulk("PKO", ["10:00:00", "10:01:00"], [45.0])
+        
+        self.assertFalse(history.has_enough_data("PKO"))
+    
+    def test_add_bulk_matches_add(self):
+        """Test that bulk seeding keeps the same window as adding one by one."""
+        bulk = PriceHistory(max_history=3)
+        single = PriceHistory(max_history=3)
+        times = [f"10:0{i}:00" for i in range(8)]
+        prices = [40.0 + i for i in range(8)]
+        
+        bulk.add_bulk("PKO", times[:2], prices[:2])
+        bulk.add_bulk("PKO", times[2:], prices[2:])
+        for time_str, price in zip(times, prices):
+            single.add("PKO", time_str, price)
+        
+        self.assertEqual(bulk.get("PKO"), single.get("PKO"))
+        
+        bulk.add("PKO", "10:08:00", 48.0)
+        single.add("PKO", "10:08:00", 48.0)
+        self.assertEqual(bulk.get("PKO"), single.get("PKO"))
+    
+    def test_get_prices_non_existing_stock(self):
+        """Test getting prices for non-existing stock."""
+        history = PriceHistory(max_history=10)
+        
+        self.assertEqual(len(history.get_prices("NONEXISTENT")), 0)
+        self.assertEqual(history.get_times("NONEXISTENT"), [])
+    
     def test_add_multiple_stocks(self):
         """Test adding entries for multiple stocks."""
         history = PriceHistory(max_history=10)
@@ -196,6 +622,55 @@ class TestPriceHistory(unittest.TestCase):
         
         self.assertEqual(result, [])
     
+    def test_snapshot(self):
+        """Test getting times and prices as parallel sequences."""
+        history = PriceHistory(max_history=2)
+        history.add("PKO", "10:00:00", 45.0)
+        history.add("PKO", "10:01:00", 46.0)
+        history.add("PKO", "10:02:00", 47.0)
+        
+        times, prices = history.snapshot("PKO")
+        
+        self.assertEqual(times, ["10:01:00", "10:02:00"])
+        self.assertEqual(prices.tolist(), [46.0, 47.0])
+        self.assertEqual(prices.dtype, np.float64)
+    
+    def test_snapshot_non_existing_stock(self):
+        """Test snapshot of a stock without history."""
+        times, prices = PriceHistory().snapshot("NONEXISTENT")
+        
+        self.assertEqual(times, [])
+        self.assertEqual(len(prices), 0)
+    
+    def test_get_prices_view_survives_add(self):
+        """Test that a kept prices view is not changed by later adds."""
+        history = PriceHistory(max_history=3)
+        for i in range(4):
+            history.add("PKO", f"10:0{i}:00", float(i))
+        
+        view = history.get_prices_view("PKO")
+        prices = history.get_prices("PKO")
+        history.add("PKO", "10:04:00", 4.0)
+        
+        self.assertTrue(view.readonly)
+        self.assertEqual(view.tolist(), [1.0, 2.0, 3.0])
+        self.assertEqual(prices.tolist(), [1.0, 2.0, 3.0])
+        self.assertEqual(history.get_prices("PKO").tolist(), [2.0, 3.0, 4.0])
+        self.assertEqual(len(history.get_prices_view("NONEXISTENT")), 0)
+    
+    def test_clear(self):
+        """Test that clear empties the history of all stocks."""
+        history = PriceHistory(max_history=3)
+        history.add("PKO", "10:00:00", 45.67)
+        history.add("KGHM", "10:00:00", 120.50)
+        
+        history.clear()
+        
+        self.assertNotIn("PKO", history)
+        self.assertEqual(history.get("KGHM"), [])
+        history.add("PKO", "10:30:00", 46.00)
+        self.assertEqual(history.get("PKO"), [("10:30:00", 46.00)])
+    
     def test_has_enough_data_true(self):
         """Test has_enough_data for stock with sufficient history."""
         history = PriceHistory(max_history=10)
@@ -0,0 +1,108 @@
+"""
+Unit tests for gpw_kurs module.
+"""
+
+import signal
+import unittest
+from unittest.mock import Mock, patch
+from src.gpw_kurs import update_stock_table, main, _stop_on_sigterm
+from src.data_fetcher import StockData, PriceHistory
+from src.input_handler import NavigationHandler
+from src.ui_display import StockTableBuilder
+
+
+class TestUpdateStockTable(unittest.TestCase):
+    """Tests for update_stock_table function."""
+    
+    def setUp(self):
+        """Set up a table with one priced and one failing stock."""
+        self.stocks = {'PKO': 45.00, 'KGHM': 0.00}
+        self.table = StockTableBuilder.create_table("Test")
+        self.navigation = NavigationHandler(list(self.stocks.keys()))
+        self.history = PriceHistory()
+        self.last_stock_data = {}
+        self.fetcher = Mock()
+        self.fetcher.get_stock_prices.return_value = {
+            'PKO': StockData('PKO.WA', 'PKO Bank Polski', 50.00, 'PLN'),
+            'KGHM': None
+        }
+    
+    def _update(self, time_str):
+        """Run one table update."""
+        return update_stock_table(
+            self.table, self.stocks, self.navigation, self.fetcher, self.history,
+            self.last_stock_data, time_str, f"2024-01-01 {time_str}"
+        )
+    
+    def test_first_update_adds_rows(self):
+        """Test that the first update adds a row per stock."""
+        self._update("10:00:00")
+        
+        self.assertEqual(len(self.table.rows), 2)
+        self.assertEqual(self.table.columns[0]._cells, ["→ PKO", "KGHM"])
+        self.assertEqual(self.table.columns[1]._cells[0], "50.00")
+        self.assertEqual(self.table.columns[1]._cells[1].plain, "ERROR")
+        self.assertEqual(self.last_stock_data['PKO']['price'], 50.00)
+        self.assertEqual(self.history.get('PKO'), [("10:00:00", 50.00)])
+        self.fetcher.save_cache_file.assert_not_called()
+    
+    def test_stale_quote_not_added_to_history(self):
+        """Test that a last-known quote is shown but kept out of the price history."""
+        self._update("10:00:00")
+        self.fetcher.get_stock_prices.return_value['PKO'] = StockData('PKO.WA', 'PKO Bank Polski', 10.00, 'PLN', stale=True)
+        
+        self._update("10:00:10")
+        
+        self.assertEqual(self.last_stock_data['PKO']['price'], 10.00)
+        self.assertEqual(self.history.get('PKO'), [("10:00:00", 50.00)])
+    
+    def test_unchanged_rows_are_skipped(self):
+        """Test that only rows with a changed quote are rewritten."""
+        self._update("10:00:00")
+        
+        with patch.object(StockTableBuilder, 'update_stock_row') as mock_stock_row, \
+             patch.object(StockTableBuilder, 'update_error_row') as mock_error_row:
+            self._update("10:01:00")
+            mock_stock_row.assert_not_called()
+            mock_error_row.assert_not_called()
+            
+            self.fetcher.get_stock_prices.return_value['PKO'] = StockData('PKO.WA', 'PKO Bank Polski', 51.00, 'PLN')
+            self._update("10:02:00")
+            mock_stock_row.assert_called_once()
+        
+        self.assertEqual(self.table.title, "📊 Stock Prices Update - 2024-01-01 10:02:00")
+        self.assertEqual(len(self.history.get('PKO')), 3)
+
+
+class TestMain(unittest.TestCase):
+    """Tests for main() shutdown handling."""
+    
+    @patch('src.gpw_kurs.signal.signal')
+    @patch('src.gpw_kurs.update_stock_table', side_effect=RuntimeError("render failed"))
+    @patch('rich.live.Live')
+    @patch('src.gpw_kurs.KeyReader')
+    @patch('src.data_fetcher.StockDataFetcher')
+    @patch('src.gpw_kurs.UIDisplay')
+    @patch('src.gpw_kurs.load_stocks_from_file', return_value={'PKO': 45.00})
+    @patch('src.gpw_kurs.sys.argv', ['gpw_kurs.py', 'akcje.txt'])
+    def test_cache_saved_when_loop_fails(self, mock_load, mock_ui, mock_fetcher_class, mock_key_reader,
+                                         mock_live, mock_update, mock_signal):
+        """Test that the fetcher is closed and quotes are saved on any exit."""
+        fetcher = mock_fetcher_class.return_value
+        
+        with self.assertRaises(RuntimeError):
+            main()
+        
+        fetcher.close.assert_called_once()
+        fetcher.save_cache_file.assert_called_once()
+        mock_ui.show_goodbye.assert_not_called()
+        mock_signal.assert_called_once_with(signal.SIGTERM, _stop_on_sigterm)
+    
+    def test_sigterm_ends_session_like_ctrl_c(self):
+        """Test that SIGTERM is turned into KeyboardInterrupt."""
+        with self.assertRaises(KeyboardInterrupt):
+            _stop_on_sigterm(signal.SIGTERM, None)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,9 +2,14 @@
 Unit tests for input_handler module.
 """
 
+import termios
 import unittest
+from collections import deque
 from unittest.mock import Mock, patch, MagicMock
-from src.input_handler import InputAction, TerminalInput, NavigationHandler
+from src.input_handler import (
+    InputAction, TerminalInput, NavigationHandler, KeyReader, check_key_nonblocking, wait_for_escape,
+    _KEY_SEQUENCES
+)
 
 
 class TestInputAction(unittest.TestCase):
@@ -136,9 +141,52 @@ class TestNavigationHandler(unittest.TestCase):
         self.assertEqual(nav.get_selected_stock(), "PKO")
 
 
+class FakeTerminal:
+    """Scripted stand-in for stdin, select.select and os.read in read tests."""
+    
+    def __init__(self):
+        self.reads = deque()
+        self.select_calls = 0
+        self.read_calls = 0
+    
+    def fileno(self):
+        return 0
+    
+    def select(self, rlist, wlist, xlist, timeout=None):
+        self.select_calls += 1
+        return (rlist if self.reads else []), [], []
+    
+    def read(self, fd, size):
+        self.read_calls += 1
+        return self.reads.popleft()
+
+
 class TestTerminalInput(unittest.TestCase):
     """Tests for TerminalInput class."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Install one fake terminal for the whole class instead of per-test patches."""
+        cls.terminal = FakeTerminal()
+        cls._patchers = [
+            patch('src.input_handler.sys.stdin', cls.terminal),
+            patch('src.input_handler.select.select', cls.terminal.select),
+            patch('src.input_handler.os.read', cls.terminal.read),
+        ]
+        for patcher in cls._patchers:
+            patcher.start()
+    
+    @classmethod
+    def tearDownClass(cls):
+        for patcher in reversed(cls._patchers):
+            patcher.stop()
+    
+    def setUp(self):
+        self.terminal.reads.clear()
+        self.terminal.select_calls = 0
+        self.terminal.read_calls = 0
+        TerminalInput._pending.clear()
+    
     @patch('src.input_handler.sys.stdin')
     @patch('src.input_handler.termios.tcgetattr')
     @patch('src.input_handler.tty.setcbreak')
@@ -163,72 +211,197 @@ class TestTerminalInput(unittest.TestCase):
         
         mock_tcsetattr.assert_called_once()
     
-    @patch('src.input_handler.select.select')
-    @patch('src.input_handler.sys.stdin')
-    def test_read_key_with_timeout_key_pressed(self, mock_stdin, mock_select):
+    def test_read_key_with_timeout_key_pressed(self):
         """Test reading key when key is pressed."""
-        mock_select.return_value = ([mock_stdin], [], [])
-        mock_stdin.read.return_value = 'a'
+        self.terminal.reads.append(b'a')
         
         result = TerminalInput.read_key_with_timeout(5)
         
         self.assertEqual(result, 'a')
     
-    @patch('src.input_handler.select.select')
-    @patch('src.input_handler.sys.stdin')
-    def test_read_key_with_timeout_timeout(self, mock_stdin, mock_select):
+    def test_read_key_with_timeout_timeout(self):
         """Test reading key when timeout occurs."""
-        mock_select.return_value = ([], [], [])
-        
         result = TerminalInput.read_key_with_timeout(5)
         
         self.assertIsNone(result)
+        self.assertEqual(self.terminal.select_calls, 1)
+        self.assertEqual(self.terminal.read_calls, 0)
     
-    @patch('src.input_handler.select.select')
-    @patch('src.input_handler.sys.stdin')
-    def test_read_key_escape_key(self, mock_stdin, mock_select):
+    def test_read_key_escape_key(self):
         """Test reading escape key."""
-        # First call returns stdin available, second returns nothing (no arrow key)
-        mock_select.side_effect = [
-            ([mock_stdin], [], []),  # ESC key available
-            ([], [], [])              # No follow-up character
-        ]
-        mock_stdin.read.return_value = '\x1b'
+        self.terminal.reads.append(b'\x1b')
         
         result = TerminalInput.read_key_with_timeout(5)
         
         self.assertEqual(result, '\x1b')
+        # One wait for the key, one short wait for the rest of a sequence
+        self.assertEqual(self.terminal.select_calls, 2)
     
-    @patch('src.input_handler.select.select')
-    @patch('src.input_handler.sys.stdin')
-    def test_read_key_arrow_up(self, mock_stdin, mock_select):
+    def test_read_key_arrow_up(self):
         """Test reading arrow up key."""
-        mock_select.side_effect = [
-            ([mock_stdin], [], []),  # ESC available
-            ([mock_stdin], [], []),  # '[' available
-            ([mock_stdin], [], [])   # 'A' available
-        ]
-        mock_stdin.read.side_effect = ['\x1b', '[', 'A']
+        self.terminal.reads.append(b'\x1b[A')
         
         result = TerminalInput.read_key_with_timeout(5)
         
         self.assertEqual(result, 'w')  # Arrow up converted to 'w'
+        self.assertEqual(self.terminal.read_calls, 1)
     
-    @patch('src.input_handler.select.select')
-    @patch('src.input_handler.sys.stdin')
-    def test_read_key_arrow_down(self, mock_stdin, mock_select):
+    def test_read_key_arrow_down(self):
         """Test reading arrow down key."""
-        mock_select.side_effect = [
-            ([mock_stdin], [], []),  # ESC available
-            ([mock_stdin], [], []),  # '[' available
-            ([mock_stdin], [], [])   # 'B' available
-        ]
-        mock_stdin.read.side_effect = ['\x1b', '[', 'B']
+        self.terminal.reads.append(b'\x1b[B')
         
         result = TerminalInput.read_key_with_timeout(5)
         
         self.assertEqual(result, 's')  # Arrow down converted to 's'
+    
+    def test_key_sequences(self):
+        """Test that CSI and SS3 arrow sequences map to navigation keys."""
+        self.assertEqual(_KEY_SEQUENCES[b'\x1b[A'], 'w')
+        self.assertEqual(_KEY_SEQUENCES[b'\x1b[B'], 's')
+        self.assertEqual(_KEY_SEQUENCES[b'\x1bOA'], 'w')
+        self.assertEqual(_KEY_SEQUENCES[b'\x1bOB'], 's')
+    
+    def test_read_available_key_other_sequence(self):
+        """Test that unknown escape sequences and end of input are handled."""
+        self.terminal.reads.extend([b'\x1b[C', b''])
+        
+        self.assertEqual(TerminalInput.read_available_key(), '\x1b')
+        self.assertIsNone(TerminalInput.read_available_key())
+    
+    def test_read_coalesced_keys(self):
+        """Test that keys arriving in one read are returned one at a time."""
+        self.terminal.reads.extend([b'ss\x1b[B', b'\x1b[B\x1b[A'])
+        
+        keys = [TerminalInput.read_key_with_timeout(5) for _ in range(5)]
+        
+        self.assertEqual(keys, ['s', 's', 's', 's', 'w'])
+        self.assertEqual(self.terminal.read_calls, 2)
+        self.assertFalse(TerminalInput.has_pending_key())
+    
+    def test_read_split_escape_sequence(self):
+        """Test that an arrow sequence split across reads is joined."""
+        self.terminal.reads.extend([b'\x1b', b'[B'])
+        
+        self.assertEqual(TerminalInput.read_key_with_timeout(5), 's')
+        self.assertEqual(self.terminal.read_calls, 2)
+
+
+class TestCheckKeyNonblocking(unittest.TestCase):
+    """Tests for check_key_nonblocking function."""
+    
+    @patch('src.input_handler.TerminalInput._restore_terminal')
+    @patch('src.input_handler.TerminalInput._set_raw_mode')
+    @patch('src.input_handler.TerminalInput.read_key_with_timeout')
+    def test_waits_for_given_timeout(self, mock_read, mock_raw, mock_restore):
+        """Test that the key wait uses the caller's timeout."""
+        mock_read.return_value = None
+        nav = NavigationHandler(["PKO", "KGHM"])
+        
+        result = check_key_nonblocking(nav, 0.75)
+        
+        self.assertIsNone(result)
+        mock_read.assert_called_once_with(0.75)
+        mock_restore.assert_called_once()
+    
+    @patch('src.input_handler.TerminalInput._restore_terminal')
+    @patch('src.input_handler.TerminalInput._set_raw_mode')
+    @patch('src.input_handler.TerminalInput.read_key_with_timeout')
+    def test_navigate_down(self, mock_read, mock_raw, mock_restore):
+        """Test that 's' moves the selection down."""
+        mock_read.return_value = 'S'
+        nav = NavigationHandler(["PKO", "KGHM"])
+        
+        result = check_key_nonblocking(nav)
+        
+        self.assertEqual(result, InputAction.NAVIGATE_DOWN)
+        self.assertEqual(nav.get_selected_index(), 1)
+        mock_read.assert_called_once_with(0.01)
+    
+    @patch('src.input_handler.TerminalInput._restore_terminal')
+    @patch('src.input_handler.TerminalInput._set_raw_mode')
+    def test_key_reader_keeps_terminal_mode(self, mock_raw, mock_restore):
+        """Test that a KeyReader avoids per-call terminal mode switches."""
+        key_reader = Mock()
+        key_reader.read_key.return_value = '\r'
+        nav = NavigationHandler(["PKO", "KGHM"])
+        
+        result = check_key_nonblocking(nav, 0.5, key_reader)
+        
+        self.assertEqual(result, InputAction.SHOW_CHART)
+        key_reader.read_key.assert_called_once_with(0.5)
+        mock_raw.assert_not_called()
+        mock_restore.assert_not_called()
 
 
+class TestWaitForEscape(unittest.TestCase):
+    """Tests for wait_for_escape function."""
+    
+    @patch('src.input_handler.console.print')
+    def test_returns_on_escape(self, mock_print):
+        """Test that other keys are skipped until ESC arrives."""
+        key_reader = Mock()
+        key_reader.read_key.side_effect = ['s', 'w', '\x1b']
+        
+        self.assertTrue(wait_for_escape(key_reader))
+        self.assertEqual(key_reader.read_key.call_count, 3)
+    
+    @patch('src.input_handler.console.print')
+    def test_returns_at_end_of_input(self, mock_print):
+        """Test that a closed stdin ends the wait instead of spinning."""
+        key_reader = Mock()
+        key_reader.read_key.side_effect = ['s', None, '\x1b']
+        
+        self.assertFalse(wait_for_escape(key_reader))
+        self.assertEqual(key_reader.read_key.call_count, 2)
+    
+    @patch('src.input_handler.console.print')
+    @patch('src.input_handler.TerminalInput._restore_terminal')
+    @patch('src.input_handler.TerminalInput._set_raw_mode')
+    @patch('src.input_handler.TerminalInput.read_key_with_timeout', return_value=None)
+    def test_without_key_reader_returns_at_end_of_input(self, mock_read, mock_raw, mock_restore, mock_print):
+        """Test the raw-mode fallback path at end of input."""
+        self.assertFalse(wait_for_escape())
+        mock_read.assert_called_once_with(None)
+        mock_restore.assert_called_once()
+
+
+class TestKeyReader(unittest.TestCase):
+    """Tests for KeyReader class."""
+    
+    @patch('src.input_handler.os.read')
+    @patch('src.input_handler.selectors.DefaultSelector')
+    @patch('src.input_handler.TerminalInput._restore_terminal')
+    @patch('src.input_handler.TerminalInput._set_raw_mode')
+    @patch('src.input_handler.sys.stdin')
+    def test_read_key_and_close(self, mock_stdin, mock_raw, mock_restore, mock_selector_class, mock_read):
+        """Test reading keys and restoring the terminal exactly once."""
+        mock_selector = mock_selector_class.return_value
+        mock_selector.select.side_effect = [[(Mock(), 1)], []]
+        mock_read.return_value = b'w'
+        
+        key_reader = KeyReader()
+        first = key_reader.read_key(1.0)
+        second = key_reader.read_key(1.0)
+        key_reader.close()
+        key_reader.close()
+        
+        self.assertEqual(first, 'w')
+        self.assertIsNone(second)
+        mock_raw.assert_called_once()
+        mock_selector.register.assert_called_once()
+        mock_restore.assert_called_once()
+        self.assertIsNone(key_reader.read_key(1.0))
+    
+    @patch('src.input_handler.selectors.DefaultSelector')
+    @patch('src.input_handler.termios.tcsetattr')
+    @patch('src.input_handler.TerminalInput._set_raw_mode')
+    @patch('src.input_handler.sys.stdin')
+    def test_context_manager_restores_immediately(self, mock_stdin, mock_raw, mock_tcsetattr, mock_selector_class):
+        """Test that leaving the 'with' block restores the terminal with TCSANOW."""
+        with KeyReader():
+            mock_tcsetattr.assert_not_called()
+        
+        mock_tcsetattr.assert_called_once_with(mock_stdin, termios.TCSANOW, mock_raw.return_value)
+
 if __name__ == '__main__':
     unittest.main()
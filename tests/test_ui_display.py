@@ -2,11 +2,21 @@
 Unit tests for ui_display module.
 """
 
+import io
 import unittest
+from types import MappingProxyType
 from unittest.mock import Mock, patch, MagicMock
-from src.ui_display import StockTableBuilder, UIDisplay, ChartDisplay
+import numpy as np
+from src.ui_display import StockTableBuilder, UIDisplay, ChartDisplay, _resample_indices, _lttb_indices
+from src.config import ConfigView
+from src.data_fetcher import StockData
+from rich.console import Console
 from rich.table import Table
 
+# Read-only stock rows shared by the table tests
+STOCK_PKO_50 = MappingProxyType({'symbol': 'PKO.WA', 'name': 'PKO Bank Polski', 'price': 50.00, 'currency': 'PLN'})
+STOCK_PKO_45 = MappingProxyType({'symbol': 'PKO.WA', 'name': 'PKO Bank Polski', 'price': 45.67, 'currency': 'PLN'})
+
 
 class TestStockTableBuilder(unittest.TestCase):
     """Tests for StockTableBuilder class."""
@@ -28,65 +38,45 @@ class TestStockTableBuilder(unittest.TestCase):
         # We can't easily check column names without accessing private attributes,
         # but we can verify it's a Table instance
     
-    def test_add_stock_row_with_profit(self):
-        """Test adding a stock row with profit."""
+    def test_add_stock_row_profit_cells(self):
+        """Test formatting of price and profit cells."""
         table = StockTableBuilder.create_table("Test")
-        stock_data = {
-            'symbol': 'PKO.WA',
-            'name': 'PKO Bank Polski',
-            'price': 50.00,
-            'currency': 'PLN'
-        }
-        purchase_price = 45.00
-        profit_loss = (11.11, 5.00, True)
+        stock_data = STOCK_PKO_50
         
-        # Should not raise any exceptions
-        StockTableBuilder.add_stock_row(table, stock_data, purchase_price, profit_loss, False)
-    
-    def test_add_stock_row_with_loss(self):
-        """Test adding a stock row with loss."""
-        table = StockTableBuilder.create_table("Test")
-        stock_data = {
-            'symbol': 'PKO.WA',
-            'name': 'PKO Bank Polski',
-            'price': 40.00,
-            'currency': 'PLN'
-        }
-        purchase_price = 45.00
-        profit_loss = (-11.11, -5.00, False)
+        StockTableBuilder.add_stock_row(table, stock_data, 45.00, (11.111, 5.0, True), False)
+        StockTableBuilder.add_stock_row(table, stock_data, 55.00, (-9.09, -5.0, False), False)
         
-        # Should not raise any exceptions
-        StockTableBuilder.add_stock_row(table, stock_data, purchase_price, profit_loss, False)
+        self.assertEqual(table.columns[1]._cells, ["50.00", "50.00"])
+        self.assertEqual([cell.plain for cell in table.columns[4]._cells], ["+11.11%", "-9.09%"])
+        self.assertEqual([cell.plain for cell in table.columns[5]._cells], ["+5.00 PLN", "-5.00 PLN"])
+        self.assertEqual([cell.style for cell in table.columns[4]._cells], ["green", "red"])
+        self.assertEqual([cell.style for cell in table.columns[5]._cells], ["green", "red"])
     
-    def test_add_stock_row_no_purchase_price(self):
-        """Test adding a stock row without purchase price."""
+    def test_add_stock_row_matrix(self):
+        """Test adding profit, loss, no purchase price and selected rows to one table."""
         table = StockTableBuilder.create_table("Test")
-        stock_data = {
-            'symbol': 'PKO.WA',
-            'name': 'PKO Bank Polski',
-            'price': 45.67,
-            'currency': 'PLN'
-        }
-        purchase_price = 0.00
-        profit_loss = (None, None, None)
+        cases = [
+            # (price, purchase_price, profit_loss, is_selected)
+            (50.00, 45.00, (11.11, 5.00, True), False),
+            (40.00, 45.00, (-11.11, -5.00, False), False),
+            (45.67, 0.00, (None, None, None), False),
+            (45.67, 45.00, (1.49, 0.67, True), True),
+        ]
         
-        # Should not raise any exceptions
-        StockTableBuilder.add_stock_row(table, stock_data, purchase_price, profit_loss, False)
-    
-    def test_add_stock_row_selected(self):
-        """Test adding a selected stock row."""
-        table = StockTableBuilder.create_table("Test")
-        stock_data = {
-            'symbol': 'PKO.WA',
-            'name': 'PKO Bank Polski',
-            'price': 45.67,
-            'currency': 'PLN'
-        }
-        purchase_price = 45.00
-        profit_loss = (1.49, 0.67, True)
+        for price, purchase_price, profit_loss, is_selected in cases:
+            with self.subTest(price=price, purchase_price=purchase_price, is_selected=is_selected):
+                stock_data = {
+                    'symbol': 'PKO.WA',
+                    'name': 'PKO Bank Polski',
+                    'price': price,
+                    'currency': 'PLN'
+                }
+                StockTableBuilder.add_stock_row(table, stock_data, purchase_price, profit_loss, is_selected)
         
-        # Should not raise any exceptions
-        StockTableBuilder.add_stock_row(table, stock_data, purchase_price, profit_loss, True)
+        self.assertEqual(table.row_count, len(cases))
+        self.assertEqual(table.columns[4]._cells[2].plain, "-")
+        self.assertEqual(table.columns[0]._cells[3], "→ PKO")
+        self.assertEqual(table.rows[3].style, "bold")
     
     def test_add_error_row(self):
         """Test adding an error row."""
@@ -102,66 +92,149 @@ class TestStockTableBuilder(unittest.TestCase):
         # Should not raise any exceptions
         StockTableBuilder.add_error_row(table, "PKO", True)
     
+    def test_update_stock_row_in_place(self):
+        """Test replacing an existing row without adding a new one."""
+        table = StockTableBuilder.create_table("Test")
+        StockTableBuilder.add_error_row(table, "PKO", False)
+        stock_data = STOCK_PKO_50
+        
+        StockTableBuilder.update_stock_row(table, 0, stock_data, 45.00, (11.11, 5.00, True), True)
+        
+        self.assertEqual(len(table.rows), 1)
+        self.assertEqual(table.columns[0]._cells[0], "→ PKO")
+        self.assertEqual(table.columns[1]._cells[0], "50.00")
+        self.assertEqual(table.rows[0].style, "bold")
+    
+    def test_update_error_row_in_place(self):
+        """Test replacing an existing row with an error row."""
+        table = StockTableBuilder.create_table("Test")
+        stock_data = STOCK_PKO_50
+        StockTableBuilder.add_stock_row(table, stock_data, 0.00, (None, None, None), False)
+        
+        StockTableBuilder.update_error_row(table, 0, "PKO", False)
+        
+        self.assertEqual(len(table.rows), 1)
+        self.assertEqual(table.columns[1]._cells[0].plain, "ERROR")
+        self.assertEqual(table.columns[1]._cells[0].style, "red")
+    
+    def test_set_row_selected(self):
+        """Test moving selection between existing rows."""
+        table = StockTableBuilder.create_table("Test")
+        stock_data = STOCK_PKO_45
+        StockTableBuilder.add_stock_row(table, stock_data, 0.00, (None, None, None), True)
+        StockTableBuilder.add_error_row(table, "KGHM", False)
+        
+        StockTableBuilder.set_row_selected(table, 0, False)
+        StockTableBuilder.set_row_selected(table, 1, True)
+        
+        self.assertEqual(table.columns[0]._cells, ["PKO", "→ KGHM"])
+        self.assertIsNone(table.rows[0].style)
+        self.assertEqual(table.rows[1].style, "bold")
+    
     def test_add_stock_row_with_stock_data_object(self):
-        """Test adding row with StockData object."""
+        """Test adding row from a StockData object converted by the caller."""
         table = StockTableBuilder.create_table("Test")
+        stock_data = StockData('PKO.WA', 'PKO Bank Polski', 45.67, 'PLN')
         
-        # Mock StockData object
-        stock_data = Mock()
-        stock_data.to_dict.return_value = {
-            'symbol': 'PKO.WA',
-            'name': 'PKO Bank Polski',
-            'price': 45.67,
-            'currency': 'PLN'
-        }
+        StockTableBuilder.add_stock_row(table, stock_data.to_dict(), 45.00, (1.49, 0.67, True), False)
         
-        purchase_price = 45.00
-        profit_loss = (1.49, 0.67, True)
+        cells = [column._cells[0] for column in table.columns]
+        self.assertEqual(cells[0], "PKO")
+        self.assertEqual(cells[1], "45.67")
+        self.assertEqual(cells[2], "PLN")
+        self.assertEqual(cells[3].plain, "PKO Bank Polski")
+        self.assertEqual(cells[5].plain, "+0.67 PLN")
+    
+    def test_name_cell_reused(self):
+        """Test that a company name is truncated once and its cell reused."""
+        table = StockTableBuilder.create_table("Test")
+        stock_data = StockData('LONG.WA', 'A' * 40, 10.0, 'PLN').to_dict()
         
-        # Should not raise any exceptions
-        StockTableBuilder.add_stock_row(table, stock_data, purchase_price, profit_loss, False)
-        stock_data.to_dict.assert_called_once()
+        StockTableBuilder.add_stock_row(table, stock_data, 0.0, (None, None, None), False)
+        StockTableBuilder.add_stock_row(table, stock_data, 0.0, (None, None, None), False)
+        
+        name_cells = table.columns[3]._cells
+        self.assertEqual(name_cells[0].plain, 'A' * 30)
+        self.assertIs(name_cells[0], name_cells[1])
 
 
 class TestUIDisplay(unittest.TestCase):
     """Tests for UIDisplay class."""
     
-    @patch('src.ui_display.console.print')
-    def test_show_header(self, mock_print):
+    @classmethod
+    def setUpClass(cls):
+        """Send UI output to one in-memory console for the whole class."""
+        cls.console = Console(file=io.StringIO(), width=100)
+        cls._console_patcher = patch('src.ui_display.console', cls.console)
+        cls._console_patcher.start()
+    
+    @classmethod
+    def tearDownClass(cls):
+        cls._console_patcher.stop()
+    
+    def setUp(self):
+        self.console.file.seek(0)
+        self.console.file.truncate()
+    
+    def _output(self):
+        """Get the text printed by the current test."""
+        return self.console.file.getvalue()
+    
+    def test_show_header(self):
         """Test showing header."""
-        UIDisplay.show_header()
-        mock_print.assert_called()
+        with patch.object(self.console, 'print', wraps=self.console.print) as mock_print:
+            UIDisplay.show_header()
+        
+        mock_print.assert_called_once()
+        self.assertIn("GPW Stock Price Monitor", self._output())
     
-    @patch('src.ui_display.console.print')
-    def test_show_error(self, mock_print):
+    def test_show_error(self):
         """Test showing error message."""
         UIDisplay.show_error("Test error")
-        mock_print.assert_called()
+        self.assertIn("Test error", self._output())
     
-    @patch('src.ui_display.console.print')
-    def test_show_loading_info(self, mock_print):
+    def test_show_loading_info(self):
         """Test showing loading info."""
         stocks = {'PKO': 45.67, 'PKNORLEN': 58.90}
-        UIDisplay.show_loading_info('test.txt', stocks, 30)
-        mock_print.assert_called()
+        with patch.object(self.console, 'print', wraps=self.console.print) as mock_print:
+            UIDisplay.show_loading_info('test.txt', stocks, 30)
+        
+        mock_print.assert_called_once()
+        self.assertIn("PKO, PKNORLEN", self._output())
+        self.assertIn("30 seconds", self._output())
     
-    @patch('src.ui_display.console.print')
-    def test_show_help(self, mock_print):
+    def test_show_help(self):
         """Test showing help message."""
         UIDisplay.show_help()
-        mock_print.assert_called()
+        self.assertIn("STOCKS_FILE", self._output())
     
+    @patch('src.ui_display.os.write')
     @patch('sys.stdout')
-    def test_clear_and_home(self, mock_stdout):
+    def test_clear_and_home(self, mock_stdout, mock_write):
         """Test clearing screen and moving cursor to home position."""
+        mock_stdout.fileno.return_value = 1
+        UIDisplay.clear_and_home()
+        mock_write.assert_called_once_with(1, b'\033[2J\033[H')
+    
+    @patch('src.ui_display.os.write')
+    @patch('sys.stdout', new_callable=io.StringIO)
+    def test_clear_and_home_without_descriptor(self, mock_stdout, mock_write):
+        """Test clearing through the text stream when stdout has no descriptor."""
         UIDisplay.clear_and_home()
-        mock_stdout.write.assert_called_once_with('\033[2J\033[H')
-        mock_stdout.flush.assert_called_once()
+        
+        mock_write.assert_not_called()
+        self.assertEqual(mock_stdout.getvalue(), '\033[2J\033[H')
 
 
 class TestChartDisplay(unittest.TestCase):
     """Tests for ChartDisplay class."""
     
+    @staticmethod
+    def _printed(mock_print):
+        """Get the text of the chart parts printed in a single call."""
+        mock_print.assert_called_once()
+        return [str(renderable) for renderable in mock_print.call_args.args[0].renderables]
+    
     @patch('src.ui_display.console.print')
     def test_draw_chart(self, mock_print):
         """Test drawing a chart."""
@@ -170,8 +243,8 @@ class TestChartDisplay(unittest.TestCase):
         
         ChartDisplay.draw_chart(price_history, "PKO.WA", config, 'PLN')
         
-        # Should print multiple times (header, chart lines, stats)
-        self.assertTrue(mock_print.call_count > 5)
+        # Header, chart lines and stats are printed together
+        self.assertTrue(len(self._printed(mock_print)) > 5)
     
     @patch('src.ui_display.console.print')
     def test_draw_chart_insufficient_data(self, mock_print):
@@ -191,6 +264,154 @@ class TestChartDisplay(unittest.TestCase):
         ChartDisplay.draw_chart(price_history, "PKO.WA", config, 'PLN')
         mock_print.assert_called()
     
+    @patch('src.ui_display.console.print')
+    def test_draw_chart_arr(self, mock_print):
+        """Test drawing a chart from parallel time and price arrays."""
+        times = ['10:00', '10:30', '11:00']
+        prices = np.array([45.67, 46.00, 45.80])
+        config = {'plot_width': 100, 'plot_height': 20}
+        
+        ChartDisplay.draw_chart_arr(times, prices, "PKO.WA", config, 'PLN')
+        
+        self.assertTrue(len(self._printed(mock_print)) > 5)
+    
+    @patch('src.ui_display.console.print')
+    def test_draw_chart_resamples_long_history(self, mock_print):
+        """Test drawing a chart with more points than chart columns."""
+        price_history = [(f"10:{i % 60:02d}", 40.0 + i % 7) for i in range(200)]
+        config = {'plot_width': 50, 'plot_height': 10}
+        
+        ChartDisplay.draw_chart(price_history, "PKO.WA", config, 'PLN')
+        
+        # Top border is as wide as the chart
+        printed = self._printed(mock_print)
+        self.assertTrue(any('─' * 50 + '┐' in text for text in printed))
+    
+    @patch('src.ui_display.console.print')
+    def test_draw_chart_body_single_renderable(self, mock_print):
+        """Test that the bordered chart body is a single renderable."""
+        price_history = [('10:00', 45.67), ('10:30', 46.00), ('11:00', 45.80)]
+        config = {'plot_width': 100, 'plot_height': 10}
+        
+        ChartDisplay.draw_chart(price_history, "PKO.WA", config, 'PLN')
+        
+        bodies = [text for text in self._printed(mock_print) if '┌' in text]
+        self.assertEqual(len(bodies), 1)
+        self.assertEqual(bodies[0].count('\n'), 11)
+    
+    @patch('src.ui_display.console.print')
+    def test_draw_chart_body_rows(self, mock_print):
+        """Test block characters of the chart rows."""
+        price_history = [('10:00', 10.00), ('10:30', 11.00)]
+        config = {'plot_width': 80, 'plot_height': 2}
+        
+        ChartDisplay.draw_chart(price_history, "ROWS.WA", config, 'PLN')
+        
+        body = next(text for text in self._printed(mock_print) if '┌' in text)
+        lines = body.split('\n')
+        self.assertEqual(lines[1], "  │  │ 11.00")
+        self.assertEqual(lines[2], "  │ █│ 10.00")
+    
+    @patch('src.ui_display.console.print')
+    def test_draw_chart_flat_prices(self, mock_print):
+        """Test that a flat series is drawn as a level line at mid-height."""
+        price_history = [('10:00', 10.00), ('10:30', 10.00), ('11:00', 10.00)]
+        config = {'plot_width': 80, 'plot_height': 4}
+        
+        ChartDisplay.draw_chart(price_history, "FLAT.WA", config, 'PLN')
+        
+        body = next(text for text in self._printed(mock_print) if '┌' in text)
+        rows = [line[3:6] for line in body.split('\n')[1:-1]]
+        self.assertEqual(rows, ["   ", "   ", "███", "   "])
+    
+    def test_draw_chart_single_write(self):
+        """Test that the whole chart reaches the terminal in one write."""
+        writes = []
+        
+        class RecordingFile(io.StringIO):
+            def write(self, text):
+                writes.append(text)
+                return super().write(text)
+        
+        price_history = [('10:00', 45.67), ('10:30', 46.00), ('11:00', 45.80)]
+        config = {'plot_width': 40, 'plot_height': 10}
+        
+        with patch('src.ui_display.console', Console(file=RecordingFile(), width=100)):
+            ChartDisplay.draw_chart(price_history, "WRITE.WA", config, 'PLN')
+        
+        self.assertEqual(len(writes), 1)
+        self.assertIn('Statistics', writes[0])
+    
+    @patch('src.ui_display.console.print')
+    def test_draw_chart_config_view(self, mock_print):
+        """Test drawing a chart sized by a ConfigView."""
+        price_history = [(f"10:{i:02d}", 40.0 + i % 7) for i in range(60)]
+        config = ConfigView(refresh_interval=30, max_history=50, plot_width=40, plot_height=10)
+        
+        ChartDisplay.draw_chart(price_history, "PKO.WA", config, 'PLN')
+        
+        printed = self._printed(mock_print)
+        self.assertTrue(any('─' * 40 + '┐' in text for text in printed))
+    
+    def test_resample_indices(self):
+        """Test that resample indices are spread over the whole series."""
+        indices = _resample_indices(200, 50)
+        
+        self.assertEqual(len(indices), 50)
+        self.assertEqual(indices[0], 0)
+        self.assertEqual(indices[-1], 196)
+        self.assertIs(indices, _resample_indices(200, 50))
+    
+    @patch('src.ui_display.console.print')
+    def test_draw_chart_reuses_unchanged_chart(self, mock_print):
+        """Test that a chart is rebuilt only when its history changes."""
+        times = ['10:00', '10:30', '11:00']
+        prices = [45.67, 46.00, 45.80]
+        config = {'plot_width': 100, 'plot_height': 20}
+        
+        with patch.object(ChartDisplay, '_build_chart', wraps=ChartDisplay._build_chart) as mock_build:
+            ChartDisplay.draw_chart_arr(times, prices, "CACHE.WA", config, 'PLN')
+            ChartDisplay.draw_chart_arr(times, prices, "CACHE.WA", config, 'PLN')
+            self.assertEqual(mock_build.call_count, 1)
+            
+            ChartDisplay.draw_chart_arr(times + ['11:30'], prices + [46.10], "CACHE.WA", config, 'PLN')
+            self.assertEqual(mock_build.call_count, 2)
+    
+    @patch('src.ui_display.console.print')
+    def test_draw_chart_rebuilds_after_full_day(self, mock_print):
+        """Test that a full history repeating yesterday's last sample is redrawn."""
+        config = {'plot_width': 100, 'plot_height': 20}
+        
+        with patch.object(ChartDisplay, '_build_chart', wraps=ChartDisplay._build_chart) as mock_build:
+            ChartDisplay.draw_chart_arr(['10:00', '10:30'], [45.00, 46.00], "DAY.WA", config, 'PLN', 100)
+            ChartDisplay.draw_chart_arr(['10:00', '10:30'], [45.00, 46.00], "DAY.WA", config, 'PLN', 100)
+            self.assertEqual(mock_build.call_count, 1)
+            
+            # Same window length, last label and last price a day later
+            ChartDisplay.draw_chart_arr(['10:15', '10:30'], [46.00, 46.00], "DAY.WA", config, 'PLN', 2980)
+            self.assertEqual(mock_build.call_count, 2)
+    
+    def test_lttb_indices_keeps_extremes(self):
+        """Test that LTTB downsampling keeps isolated peaks and troughs."""
+        values = np.zeros(200)
+        values[77] = 10.0
+        values[150] = -5.0
+        
+        indices = _lttb_indices(values, 20)
+        
+        self.assertEqual(len(indices), 20)
+        self.assertEqual(indices[0], 0)
+        self.assertEqual(indices[-1], 199)
+        self.assertIn(77, indices)
+        self.assertIn(150, indices)
+        self.assertTrue((np.diff(indices) > 0).all())
+    
+    def test_lttb_indices_short_series(self):
+        """Test that series not longer than the threshold are kept whole."""
+        indices = _lttb_indices(np.arange(5.0), 10)
+        
+        self.assertEqual(indices.tolist(), [0, 1, 2, 3, 4])
+    
     @patch('src.ui_display.console.print')
     def test_draw_chart_custom_size(self, mock_print):
         """Test drawing chart with custom size."""
@@ -199,8 +420,7 @@ class TestChartDisplay(unittest.TestCase):
         
         ChartDisplay.draw_chart(price_history, "PKO.WA", config, 'USD')
         
-        # Should print multiple times
-        self.assertTrue(mock_print.call_count > 0)
+        self.assertTrue(len(self._printed(mock_print)) > 0)
 
 
 if __name__ == '__main__':